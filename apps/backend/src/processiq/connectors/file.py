@@ -11,14 +11,25 @@ Universal file connector supporting:
 
 import os
 import asyncio
+import atexit
+import codecs
+import fnmatch
+import hashlib
+import importlib.util
+import mmap
+import multiprocessing
+import pickle
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, AsyncGenerator, Union, BinaryIO
+from typing import Any, Dict, Iterator, List, Optional, AsyncGenerator, Tuple, Union, BinaryIO
 from datetime import datetime
 import mimetypes
 
 import pandas as pd
-import json
+import orjson
 import csv
 from pydantic import BaseModel, Field
 
@@ -50,6 +61,90 @@ class StorageType(Enum):
     SFTP = "sftp"
 
 
+# JSON documents larger than this are parsed straight from a read-only mmap
+JSON_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Number of paths stat'ed per worker task during directory discovery
+STAT_BATCH_SIZE = 512
+
+
+def _stat_paths(paths: List[str]) -> List[Optional[os.stat_result]]:
+    """Stat each path, returning None for paths that cannot be stat'ed
+    
+    A file that vanished, is not readable or sits on a broken mount is
+    skipped rather than failing discovery for the whole batch.
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append(os.stat(path))
+        except OSError:
+            results.append(None)
+    return results
+
+
+class DiscoveredFiles:
+    """
+    Column-oriented (struct-of-arrays) store for discovered file metadata.
+    
+    Each attribute is kept in its own list so filters scan a single column,
+    with secondary indexes for O(1) lookup by file type and path. Per-file
+    dicts are only materialized when handed to the processors.
+    """
+    
+    COLUMNS = ("path", "name", "size", "size_mb", "modified", "mtime_ns", "mime_type", "file_type", "extension")
+    
+    def __init__(self) -> None:
+        self.columns: Dict[str, List[Any]] = {column: [] for column in self.COLUMNS}
+        self._by_type: Dict[FileType, List[int]] = {}
+        self._by_path: Dict[str, int] = {}
+        # Bumped on every mutation so derived views can tell they are stale
+        self.version = 0
+    
+    def __len__(self) -> int:
+        return len(self.columns["path"])
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self.row(index) for index in range(len(self)))
+    
+    def append(self, file_info: Dict[str, Any]) -> None:
+        """Add a file info dict as a new row"""
+        index = len(self)
+        for column, values in self.columns.items():
+            values.append(file_info[column])
+        self._by_type.setdefault(file_info["file_type"], []).append(index)
+        self._by_path[file_info["path"]] = index
+        self.version += 1
+    
+    def clear(self) -> None:
+        """Remove all rows"""
+        for values in self.columns.values():
+            values.clear()
+        self._by_type.clear()
+        self._by_path.clear()
+        self.version += 1
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """Materialize a single row as a file info dict"""
+        return {column: values[index] for column, values in self.columns.items()}
+    
+    def rows(self, indices: List[int]) -> List[Dict[str, Any]]:
+        """Materialize the given rows as file info dicts"""
+        return [self.row(index) for index in indices]
+    
+    def indices_of_type(self, file_type: FileType) -> List[int]:
+        """Row indices of files with the given type"""
+        return self._by_type.get(file_type, [])
+    
+    def index_of_path(self, path: str) -> Optional[int]:
+        """Row index of the file at ``path``, if discovered"""
+        return self._by_path.get(path)
+    
+    def type_counts(self) -> Dict[FileType, int]:
+        """Number of files per type, read off the type index"""
+        return {file_type: len(indices) for file_type, indices in self._by_type.items()}
+
+
 class FileConnectorConfig(ConnectorConfig):
     """Configuration for file connector"""
     
@@ -84,6 +179,7 @@ class FileConnectorConfig(ConnectorConfig):
     # Document processing
     ocr_enabled: bool = False
     ocr_language: str = "eng"
+    ocr_page_seg_mode: int = 6  # Tesseract PSM; 6 = single uniform block of text
     extract_metadata: bool = True
     
     # Performance settings
@@ -91,6 +187,11 @@ class FileConnectorConfig(ConnectorConfig):
     parallel_processing: bool = True
     max_workers: int = 4
     
+    # Parse cache - reuse records of files whose path, size and mtime are unchanged
+    parse_cache_enabled: bool = False
+    parse_cache_dir: str = "./data/parse_cache"
+    parse_cache_max_size_mb: int = 512
+    
     # Cloud storage specific
     aws_region: Optional[str] = None
     aws_access_key: Optional[str] = None
@@ -105,6 +206,111 @@ class FileConnectorConfig(ConnectorConfig):
     gcs_bucket_name: Optional[str] = None
 
 
+class ParseCache:
+    """
+    On-disk cache of parsed records.
+    
+    Entries are keyed by a file's path, size and mtime plus the parse options,
+    so an unchanged file is never parsed twice. Least recently used entries
+    are evicted once the cache directory grows past its size budget.
+    
+    Entries are pickles and are loaded as-is, so the cache directory must be
+    trusted and private to this process' user - anyone who can write to it
+    can run code in the connector.
+    """
+    
+    def __init__(self, directory: Union[str, Path], max_size_mb: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        
+        # Running size of the cache, seeded once so puts only rescan the
+        # directory when they actually push it over budget
+        self._lock = threading.Lock()
+        self._total_size = sum(entry.stat().st_size for entry in self.directory.glob("*.pkl"))
+    
+    @staticmethod
+    def key(file_info: Dict[str, Any], *options: Any) -> str:
+        """Build the cache key for a discovered file"""
+        signature = f"{file_info['path']}|{file_info['size']}|{file_info['mtime_ns']}|{options!r}"
+        return hashlib.blake2b(signature.encode(), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[List[DataRecord]]:
+        """Return cached records, or None on a miss"""
+        entry = self.directory / f"{key}.pkl"
+        try:
+            with entry.open('rb') as f:
+                records = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry - drop it and re-parse
+            self._remove(entry)
+            return None
+        
+        # Touch the entry so eviction sees it as recently used; if eviction
+        # removed it in the meantime, treat the lookup as a miss
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        return records
+    
+    def put(self, key: str, records: List[DataRecord]) -> None:
+        """Store records and evict old entries if over budget"""
+        entry = self.directory / f"{key}.pkl"
+        # Unique temp file so concurrent puts of one key don't interleave
+        tmp_file = tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False)
+        tmp_entry = tmp_file.name
+        try:
+            with tmp_file:
+                pickle.dump(records, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            os.unlink(tmp_entry)
+            raise
+        
+        with self._lock:
+            try:
+                replaced_size = entry.stat().st_size
+            except FileNotFoundError:
+                replaced_size = 0
+            os.replace(tmp_entry, entry)
+            self._total_size += entry.stat().st_size - replaced_size
+            
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+    
+    def _remove(self, entry: Path) -> None:
+        with self._lock:
+            try:
+                size = entry.stat().st_size
+                entry.unlink()
+            except FileNotFoundError:
+                return
+            self._total_size -= size
+    
+    def _evict(self) -> None:
+        # Caller holds the lock; resync with the directory while scanning
+        entries = []
+        total_size = 0
+        for entry in self.directory.glob("*.pkl"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total_size += stat.st_size
+        
+        entries.sort()
+        for _, size, entry in entries:
+            if total_size <= self.max_size_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= size
+        
+        self._total_size = total_size
+
+
 class FileConnector(ConnectorInterface):
     """
     Universal file connector supporting local and cloud storage
@@ -123,7 +329,15 @@ class FileConnector(ConnectorInterface):
         self._pdf_processor = None
         
         # Discovered files cache
-        self._discovered_files: List[Dict[str, Any]] = []
+        self._discovered_files = DiscoveredFiles()
+        
+        # get_schema result, tagged with the discovery version it was built from
+        self._schema_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        
+        # Parsed records cache
+        self._parse_cache: Optional[ParseCache] = None
+        if config.parse_cache_enabled:
+            self._parse_cache = ParseCache(config.parse_cache_dir, config.parse_cache_max_size_mb)
     
     @property
     def connector_type(self) -> str:
@@ -174,6 +388,10 @@ class FileConnector(ConnectorInterface):
                     await self._storage_client.close()
                 self._storage_client = None
             
+            if self._ocr_processor:
+                await self._ocr_processor.close()
+                self._ocr_processor = None
+            
             self._discovered_files.clear()
             
             await self.set_status(ConnectorStatus.DISCONNECTED)
@@ -275,24 +493,73 @@ class FileConnector(ConnectorInterface):
         
         if self.config.file_path:
             # Single file
-            file_info = await self._get_file_info(Path(self.config.file_path))
+            file_info = await self._get_file_info(self.config.file_path)
             if file_info:
                 self._discovered_files.append(file_info)
         
         elif self.config.directory_path:
             # Directory with pattern
-            directory = Path(self.config.directory_path)
+            paths = list(self._scan_local_files(
+                self.config.directory_path, self.config.file_pattern, self.config.recursive
+            ))
+            stats = await self._stat_files(paths)
             
-            if self.config.recursive:
-                pattern = f"**/{self.config.file_pattern}"
-            else:
-                pattern = self.config.file_pattern
+            for file_path, stat in zip(paths, stats):
+                if stat is None:
+                    continue  # Removed between listing and stat
+                file_info = await self._get_file_info(file_path, stat)
+                if file_info:
+                    self._discovered_files.append(file_info)
+    
+    def _scan_local_files(self, directory: str, pattern: str, recursive: bool) -> Iterator[str]:
+        """Yield paths of regular files in directory matching pattern
+        
+        Uses os.scandir so the directory listing's cached entry type answers
+        is_file() without a stat call or Path objects.
+        """
+        
+        if "/" in pattern or os.sep in pattern:
+            # Patterns spanning directories need full glob semantics
+            glob_pattern = f"**/{pattern}" if recursive else pattern
+            for path in Path(directory).glob(glob_pattern):
+                if path.is_file():
+                    yield str(path)
+            return
+        
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError:
+                continue  # Unreadable directory - skip it like Path.glob does
             
-            for file_path in directory.glob(pattern):
-                if file_path.is_file():
-                    file_info = await self._get_file_info(file_path)
-                    if file_info:
-                        self._discovered_files.append(file_info)
+            with entries:
+                for entry in entries:
+                    if entry.is_file():
+                        if fnmatch.fnmatch(entry.name, pattern):
+                            yield entry.path
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+    
+    async def _stat_files(self, paths: List[str]) -> List[Optional[os.stat_result]]:
+        """Stat paths in batches on worker threads, bounded by max_workers
+        
+        Keeps several metadata requests in flight at once, which hides the
+        per-file latency of slow disks and network or FUSE mounts.
+        """
+        
+        semaphore = asyncio.Semaphore(self.config.max_workers)
+        
+        async def stat_batch(batch: List[str]) -> List[Optional[os.stat_result]]:
+            async with semaphore:
+                return await asyncio.to_thread(_stat_paths, batch)
+        
+        results = await asyncio.gather(*(
+            stat_batch(paths[i:i + STAT_BATCH_SIZE])
+            for i in range(0, len(paths), STAT_BATCH_SIZE)
+        ))
+        return [stat for batch in results for stat in batch]
     
     async def _discover_cloud_files(self) -> None:
         """Discover cloud storage files"""
@@ -300,11 +567,16 @@ class FileConnector(ConnectorInterface):
         # For now, placeholder
         pass
     
-    async def _get_file_info(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    async def _get_file_info(
+        self, 
+        file_path: str, 
+        stat: Optional[os.stat_result] = None
+    ) -> Optional[Dict[str, Any]]:
         """Get file information and metadata"""
         
         try:
-            stat = file_path.stat()
+            if stat is None:
+                stat = os.stat(file_path)
             
             # Check file size limit
             size_mb = stat.st_size / (1024 * 1024)
@@ -312,32 +584,32 @@ class FileConnector(ConnectorInterface):
                 return None
             
             # Detect file type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            file_type = self._detect_file_type(file_path, mime_type)
+            mime_type, _ = mimetypes.guess_type(file_path)
+            extension = os.path.splitext(file_path)[1].lower()
+            file_type = self._detect_file_type(extension, mime_type)
             
             # Skip binary files if configured
             if self.config.skip_binary_files and file_type == FileType.BINARY:
                 return None
             
             return {
-                "path": str(file_path),
-                "name": file_path.name,
+                "path": file_path,
+                "name": os.path.basename(file_path),
                 "size": stat.st_size,
                 "size_mb": size_mb,
                 "modified": datetime.fromtimestamp(stat.st_mtime),
+                "mtime_ns": stat.st_mtime_ns,
                 "mime_type": mime_type,
                 "file_type": file_type,
-                "extension": file_path.suffix.lower()
+                "extension": extension
             }
             
         except Exception as e:
             await self.handle_error(e, f"get_file_info:{file_path}")
             return None
     
-    def _detect_file_type(self, file_path: Path, mime_type: Optional[str]) -> FileType:
-        """Detect file type from extension and MIME type"""
-        
-        extension = file_path.suffix.lower()
+    def _detect_file_type(self, extension: str, mime_type: Optional[str]) -> FileType:
+        """Detect file type from lower-cased extension and MIME type"""
         
         # Text-based formats
         if extension in ['.csv']:
@@ -394,9 +666,29 @@ class FileConnector(ConnectorInterface):
             
             # Process files
             for file_info in files_to_process:
+                remaining = limit - len(all_records) if limit else None
+                file_start = len(all_records)
+                
                 try:
-                    records = await self._process_file(file_info, limit)
-                    all_records.extend(records)
+                    cache_key = None
+                    cached_records = None
+                    if self._parse_cache:
+                        cache_key = ParseCache.key(file_info, remaining, self._parse_options())
+                        cached_records = await asyncio.to_thread(self._parse_cache.get, cache_key)
+                    
+                    if cached_records is not None:
+                        all_records.extend(cached_records)
+                    else:
+                        if file_info["file_type"] == FileType.CSV:
+                            # Drain CSV batches so only one chunk is in flight
+                            async for batch in self._process_csv_file_batches(file_info["path"], remaining):
+                                all_records.extend(batch)
+                        else:
+                            records = await self._process_file(file_info, remaining)
+                            all_records.extend(records)
+                        
+                        if cache_key:
+                            await asyncio.to_thread(self._parse_cache.put, cache_key, all_records[file_start:])
                     
                     # Check limit across all files
                     if limit and len(all_records) >= limit:
@@ -404,6 +696,8 @@ class FileConnector(ConnectorInterface):
                         break
                         
                 except Exception as e:
+                    # A failed file contributes nothing, not the batches read so far
+                    del all_records[file_start:]
                     await self.handle_error(e, f"process_file:{file_info['name']}")
                     if not self.config.continue_on_error:
                         raise
@@ -443,25 +737,27 @@ class FileConnector(ConnectorInterface):
     def _get_files_to_process(self, query: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Determine which files to process based on query"""
         
+        files = self._discovered_files
+        
         if not query:
-            return self._discovered_files
+            return list(files)
         
         # Filter by file type
         if "file_type" in query:
             file_type = FileType(query["file_type"])
-            return [f for f in self._discovered_files if f["file_type"] == file_type]
+            return files.rows(files.indices_of_type(file_type))
         
         # Filter by pattern
         if "pattern" in query:
             pattern = query["pattern"]
-            return [f for f in self._discovered_files if pattern in f["name"]]
+            return files.rows([i for i, name in enumerate(files.columns["name"]) if pattern in name])
         
         # Specific file
         if "file_path" in query:
-            file_path = query["file_path"]
-            return [f for f in self._discovered_files if f["path"] == file_path]
+            index = files.index_of_path(query["file_path"])
+            return [] if index is None else [files.row(index)]
         
-        return self._discovered_files
+        return list(files)
     
     # File Processing
     
@@ -470,31 +766,40 @@ class FileConnector(ConnectorInterface):
         file_info: Dict[str, Any], 
         limit: Optional[int]
     ) -> List[DataRecord]:
-        """Process a single file based on its type"""
+        """Process a single file based on its type
+        
+        Errors propagate to the caller, which decides whether to continue.
+        """
         
         file_type = file_info["file_type"]
         file_path = file_info["path"]
         
-        try:
-            if file_type == FileType.CSV:
-                return await self._process_csv_file(file_path, limit)
-            elif file_type == FileType.JSON:
-                return await self._process_json_file(file_path, limit)
-            elif file_type == FileType.EXCEL:
-                return await self._process_excel_file(file_path, limit)
-            elif file_type == FileType.TEXT:
-                return await self._process_text_file(file_path, limit)
-            elif file_type == FileType.PDF:
-                return await self._process_pdf_file(file_path, limit)
-            elif file_type == FileType.IMAGE:
-                return await self._process_image_file(file_path, limit)
-            else:
-                # Binary or unknown file type
-                return await self._process_binary_file(file_path, limit)
-                
-        except Exception as e:
-            await self.handle_error(e, f"process_file:{file_info['name']}")
-            return []
+        if file_type == FileType.CSV:
+            return await self._process_csv_file(file_path, limit)
+        elif file_type == FileType.JSON:
+            return await self._process_json_file(file_path, limit)
+        elif file_type == FileType.EXCEL:
+            return await self._process_excel_file(file_path, limit)
+        elif file_type == FileType.TEXT:
+            return await self._process_text_file(file_path, limit)
+        elif file_type == FileType.PDF:
+            return await self._process_pdf_file(file_path, limit)
+        elif file_type == FileType.IMAGE:
+            return await self._process_image_file(file_path, limit)
+        else:
+            # Binary or unknown file type
+            return await self._process_binary_file(file_info, limit)
+    
+    def _parse_options(self) -> tuple:
+        """Config values that affect parsed output, part of the parse cache key"""
+        
+        config = self.config
+        return (
+            config.file_encoding, config.csv_delimiter, config.csv_quote_char,
+            config.csv_has_header, config.csv_skip_rows, config.json_lines,
+            config.json_flatten, config.excel_sheet_name, config.excel_header_row,
+            config.ocr_enabled, config.ocr_language, config.ocr_page_seg_mode
+        )
     
     async def _stream_file(self, file_info: Dict[str, Any]) -> AsyncGenerator[DataRecord, None]:
         """Stream records from a single file"""
@@ -519,33 +824,58 @@ class FileConnector(ConnectorInterface):
     async def _process_csv_file(self, file_path: str, limit: Optional[int]) -> List[DataRecord]:
         """Process CSV file"""
         
+        records = []
+        async for batch in self._process_csv_file_batches(file_path, limit):
+            records.extend(batch)
+        
+        return records
+    
+    async def _process_csv_file_batches(
+        self, 
+        file_path: str, 
+        limit: Optional[int], 
+        batch_size: Optional[int] = None
+    ) -> AsyncGenerator[List[DataRecord], None]:
+        """Process CSV file in batches of at most ``batch_size`` records
+        
+        Callers should drain each batch before requesting the next one so
+        peak memory stays proportional to the batch size, not the file size.
+        """
+        
         try:
-            df = pd.read_csv(
+            with pd.read_csv(
                 file_path,
                 delimiter=self.config.csv_delimiter,
                 quotechar=self.config.csv_quote_char,
                 header=0 if self.config.csv_has_header else None,
                 skiprows=self.config.csv_skip_rows,
                 encoding=self.config.file_encoding,
-                nrows=limit
-            )
-            
-            records = []
-            for i, row in df.iterrows():
-                record = DataRecord(
-                    id=str(i),
-                    data=row.to_dict(),
-                    metadata={
-                        "file_path": file_path,
-                        "file_type": "csv",
-                        "row_number": i + 1
-                    },
-                    timestamp=datetime.utcnow(),
-                    source=f"file:{file_path}"
-                )
-                records.append(record)
-            
-            return records
+                nrows=limit,
+                chunksize=batch_size or self.config.chunk_size
+            ) as chunk_iter:
+                source = f"file:{file_path}"
+                row_offset = 0
+                for chunk in chunk_iter:
+                    # All rows of a chunk share one ingest timestamp
+                    timestamp = datetime.utcnow()
+                    # to_dict("records") zips each row against the header in one
+                    # pass, avoiding the per-row Series that iterrows() builds
+                    batch = [
+                        DataRecord(
+                            id=str(row_number - 1),
+                            data=row,
+                            metadata={
+                                "file_path": file_path,
+                                "file_type": "csv",
+                                "row_number": row_number
+                            },
+                            timestamp=timestamp,
+                            source=source
+                        )
+                        for row_number, row in enumerate(chunk.to_dict("records"), row_offset + 1)
+                    ]
+                    row_offset += len(batch)
+                    yield batch
             
         except Exception as e:
             raise ProcessingError(f"Failed to process CSV file {file_path}: {e}")
@@ -553,52 +883,27 @@ class FileConnector(ConnectorInterface):
     async def _stream_csv_file(self, file_path: str) -> AsyncGenerator[DataRecord, None]:
         """Stream CSV file records"""
         
-        try:
-            chunk_iter = pd.read_csv(
-                file_path,
-                delimiter=self.config.csv_delimiter,
-                quotechar=self.config.csv_quote_char,
-                header=0 if self.config.csv_has_header else None,
-                skiprows=self.config.csv_skip_rows,
-                encoding=self.config.file_encoding,
-                chunksize=self.config.chunk_size
-            )
-            
-            row_number = 1
-            for chunk in chunk_iter:
-                for i, row in chunk.iterrows():
-                    record = DataRecord(
-                        id=str(row_number),
-                        data=row.to_dict(),
-                        metadata={
-                            "file_path": file_path,
-                            "file_type": "csv",
-                            "row_number": row_number
-                        },
-                        timestamp=datetime.utcnow(),
-                        source=f"file:{file_path}"
-                    )
-                    yield record
-                    row_number += 1
-                    
-        except Exception as e:
-            raise ProcessingError(f"Failed to stream CSV file {file_path}: {e}")
+        async for batch in self._process_csv_file_batches(file_path, None):
+            for record in batch:
+                yield record
     
     async def _process_json_file(self, file_path: str, limit: Optional[int]) -> List[DataRecord]:
         """Process JSON file"""
         
         try:
             records = []
+            timestamp = datetime.utcnow()
+            source = f"file:{file_path}"
             
-            with open(file_path, 'r', encoding=self.config.file_encoding) as f:
-                if self.config.json_lines:
-                    # JSONL format - one JSON object per line
+            if self.config.json_lines:
+                # JSONL format - one JSON object per line
+                with open(file_path, 'r', encoding=self.config.file_encoding) as f:
                     for i, line in enumerate(f):
                         if limit and i >= limit:
                             break
                         
                         try:
-                            data = json.loads(line.strip())
+                            data = orjson.loads(line)
                             
                             if self.config.json_flatten and isinstance(data, dict):
                                 data = self._flatten_dict(data)
@@ -611,60 +916,76 @@ class FileConnector(ConnectorInterface):
                                     "file_type": "json",
                                     "line_number": i + 1
                                 },
-                                timestamp=datetime.utcnow(),
-                                source=f"file:{file_path}"
+                                timestamp=timestamp,
+                                source=source
                             )
                             records.append(record)
                             
-                        except json.JSONDecodeError:
+                        except orjson.JSONDecodeError:
                             continue  # Skip invalid JSON lines
-                else:
-                    # Regular JSON file
-                    data = json.load(f)
-                    
-                    if isinstance(data, list):
-                        # Array of objects
-                        for i, item in enumerate(data):
-                            if limit and i >= limit:
-                                break
-                            
-                            if self.config.json_flatten and isinstance(item, dict):
-                                item = self._flatten_dict(item)
-                            
-                            record = DataRecord(
-                                id=str(i),
-                                data=item,
-                                metadata={
-                                    "file_path": file_path,
-                                    "file_type": "json",
-                                    "array_index": i
-                                },
-                                timestamp=datetime.utcnow(),
-                                source=f"file:{file_path}"
-                            )
-                            records.append(record)
-                    else:
-                        # Single JSON object
-                        if self.config.json_flatten and isinstance(data, dict):
-                            data = self._flatten_dict(data)
+            else:
+                # Regular JSON file
+                data = self._load_json_document(file_path)
+                
+                if isinstance(data, list):
+                    # Array of objects
+                    for i, item in enumerate(data):
+                        if limit and i >= limit:
+                            break
+                        
+                        if self.config.json_flatten and isinstance(item, dict):
+                            item = self._flatten_dict(item)
                         
                         record = DataRecord(
-                            id="0",
-                            data=data,
+                            id=str(i),
+                            data=item,
                             metadata={
                                 "file_path": file_path,
-                                "file_type": "json"
+                                "file_type": "json",
+                                "array_index": i
                             },
-                            timestamp=datetime.utcnow(),
-                            source=f"file:{file_path}"
+                            timestamp=timestamp,
+                            source=source
                         )
                         records.append(record)
+                else:
+                    # Single JSON object
+                    if self.config.json_flatten and isinstance(data, dict):
+                        data = self._flatten_dict(data)
+                    
+                    record = DataRecord(
+                        id="0",
+                        data=data,
+                        metadata={
+                            "file_path": file_path,
+                            "file_type": "json"
+                        },
+                        timestamp=timestamp,
+                        source=source
+                    )
+                    records.append(record)
             
             return records
             
         except Exception as e:
             raise ProcessingError(f"Failed to process JSON file {file_path}: {e}")
     
+    def _load_json_document(self, file_path: str) -> Any:
+        """Parse a whole JSON document, mapping large UTF-8 files instead of reading them"""
+        
+        is_utf8 = codecs.lookup(self.config.file_encoding).name == "utf-8"
+        
+        with open(file_path, 'rb') as f:
+            if is_utf8 and os.fstat(f.fileno()).st_size > JSON_MMAP_THRESHOLD:
+                # orjson parses the mapped pages in place, no userspace copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            
+            raw = f.read()
+        
+        # orjson only accepts UTF-8 input; decode other encodings first
+        return orjson.loads(raw if is_utf8 else raw.decode(self.config.file_encoding))
+    
     async def _stream_json_file(self, file_path: str) -> AsyncGenerator[DataRecord, None]:
         """Stream JSON file records"""
         
@@ -678,26 +999,31 @@ class FileConnector(ConnectorInterface):
         """Process Excel file"""
         
         try:
+            # Rust-backed calamine reader; it skips the per-cell style
+            # objects openpyxl builds and is several times faster
             df = pd.read_excel(
                 file_path,
-                sheet_name=self.config.excel_sheet_name,
+                sheet_name=self.config.excel_sheet_name if self.config.excel_sheet_name is not None else 0,
                 header=self.config.excel_header_row,
-                nrows=limit
+                nrows=limit,
+                engine="calamine"
             )
             
             records = []
-            for i, row in df.iterrows():
+            timestamp = datetime.utcnow()
+            source = f"file:{file_path}"
+            for i, row in enumerate(df.to_dict("records")):
                 record = DataRecord(
                     id=str(i),
-                    data=row.to_dict(),
+                    data=row,
                     metadata={
                         "file_path": file_path,
                         "file_type": "excel",
                         "sheet_name": self.config.excel_sheet_name,
                         "row_number": i + 1
                     },
-                    timestamp=datetime.utcnow(),
-                    source=f"file:{file_path}"
+                    timestamp=timestamp,
+                    source=source
                 )
                 records.append(record)
             
@@ -711,6 +1037,8 @@ class FileConnector(ConnectorInterface):
         
         try:
             records = []
+            timestamp = datetime.utcnow()
+            source = f"file:{file_path}"
             
             with open(file_path, 'r', encoding=self.config.file_encoding) as f:
                 for i, line in enumerate(f):
@@ -725,8 +1053,8 @@ class FileConnector(ConnectorInterface):
                             "file_type": "text",
                             "line_number": i + 1
                         },
-                        timestamp=datetime.utcnow(),
-                        source=f"file:{file_path}"
+                        timestamp=timestamp,
+                        source=source
                     )
                     records.append(record)
             
@@ -736,28 +1064,97 @@ class FileConnector(ConnectorInterface):
             raise ProcessingError(f"Failed to process text file {file_path}: {e}")
     
     async def _process_pdf_file(self, file_path: str, limit: Optional[int]) -> List[DataRecord]:
-        """Process PDF file with text extraction"""
+        """Process PDF file with text extraction, one record per page"""
         
         try:
-            # Would use library like PyPDF2, pdfplumber, or pymupdf
-            # For now, placeholder implementation
+            import pypdfium2 as pdfium
+        except ImportError:
+            raise ProcessingError("pypdfium2 package required for PDF processing")
+        
+        try:
+            # pdfium work is blocking, so it runs off the event loop
+            pdf = await asyncio.to_thread(pdfium.PdfDocument, file_path)
+            try:
+                page_count = len(pdf)
+                texts = await asyncio.to_thread(
+                    self._read_pdf_text, pdf, min(page_count, limit) if limit else page_count
+                )
+                
+                # Pages without a text layer, to be OCRed
+                scanned_pages = [
+                    i for i, text in enumerate(texts) if not text.strip()
+                ] if self.config.ocr_enabled else []
+                
+                # Render and OCR them a window at a time so only a bounded
+                # number of page images is in memory (and in flight) at once
+                ocr_errors = {}
+                window = max(1, self.config.max_workers)
+                for start in range(0, len(scanned_pages), window):
+                    indices = scanned_pages[start:start + window]
+                    images = await asyncio.to_thread(self._render_pdf_pages, pdf, indices)
+                    ocr_results = await self._ocr_images(images)
+                    del images
+                    
+                    for i, result in zip(indices, ocr_results):
+                        if isinstance(result, Exception):
+                            ocr_errors[i] = str(result)
+                        else:
+                            texts[i] = result
+            finally:
+                await asyncio.to_thread(pdf.close)
             
-            records = [DataRecord(
-                id="0",
-                data={"content": "PDF content extraction not implemented yet"},
-                metadata={
-                    "file_path": file_path,
-                    "file_type": "pdf"
-                },
-                timestamp=datetime.utcnow(),
-                source=f"file:{file_path}"
-            )]
+            ocr_pages = set(scanned_pages) - set(ocr_errors)
+            
+            records = []
+            timestamp = datetime.utcnow()
+            source = f"file:{file_path}"
+            for i, text in enumerate(texts):
+                data = {"page_number": i + 1, "content": text}
+                if i in ocr_errors:
+                    data["ocr_error"] = ocr_errors[i]
+                
+                record = DataRecord(
+                    id=str(i),
+                    data=data,
+                    metadata={
+                        "file_path": file_path,
+                        "file_type": "pdf",
+                        "page_number": i + 1,
+                        "page_count": page_count,
+                        "text_source": "ocr" if i in ocr_pages else "text_layer"
+                    },
+                    timestamp=timestamp,
+                    source=source
+                )
+                records.append(record)
             
             return records
             
         except Exception as e:
             raise ProcessingError(f"Failed to process PDF file {file_path}: {e}")
     
+    @staticmethod
+    def _read_pdf_text(pdf: Any, page_count: int) -> List[str]:
+        """Text layer of the first page_count pages"""
+        texts = []
+        for i in range(page_count):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return texts
+    
+    @staticmethod
+    def _render_pdf_pages(pdf: Any, indices: List[int]) -> List[Any]:
+        """Render the given pages to PIL images for OCR"""
+        images = []
+        for i in indices:
+            page = pdf[i]
+            images.append(page.render(scale=2).to_pil())
+            page.close()
+        return images
+    
     async def _process_image_file(self, file_path: str, limit: Optional[int]) -> List[DataRecord]:
         """Process image file with OCR if enabled"""
         
@@ -804,12 +1201,13 @@ class FileConnector(ConnectorInterface):
         except Exception as e:
             raise ProcessingError(f"Failed to process image file {file_path}: {e}")
     
-    async def _process_binary_file(self, file_path: str, limit: Optional[int]) -> List[DataRecord]:
+    async def _process_binary_file(self, file_info: Dict[str, Any], limit: Optional[int]) -> List[DataRecord]:
         """Process binary file (basic metadata only)"""
         
+        file_path = file_info["path"]
+        
         try:
-            file_info = await self._get_file_info(Path(file_path))
-            
+            # Discovery already stat'ed the file; reuse its info instead of re-reading it
             record = DataRecord(
                 id="0",
                 data={
@@ -817,7 +1215,7 @@ class FileConnector(ConnectorInterface):
                     "size": file_info["size"],
                     "mime_type": file_info["mime_type"]
                 },
-                metadata=file_info,
+                metadata=dict(file_info),
                 timestamp=datetime.utcnow(),
                 source=f"file:{file_path}"
             )
@@ -832,57 +1230,180 @@ class FileConnector(ConnectorInterface):
     def _flatten_dict(self, d: dict, parent_key: str = '', sep: str = '.') -> dict:
         """Flatten nested dictionary"""
         
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
+        # Depth-first walk over an explicit stack of item iterators; keeps the
+        # recursive version's key order without a call frame per nesting level
+        flat = {}
+        stack = [(parent_key, iter(d.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                if isinstance(v, dict):
+                    stack.append((new_key, iter(v.items())))
+                    break
+                flat[new_key] = v
             else:
-                items.append((new_key, v))
-        return dict(items)
+                stack.pop()
+        return flat
+    
+    async def _ocr_images(self, images: List[Any]) -> List[Union[str, Exception]]:
+        """Run OCR over in-memory images concurrently
+        
+        Failures are returned in place of the text so one bad page does not
+        discard the rest of the batch.
+        """
+        
+        if not self._ocr_processor:
+            return [ProcessingError("OCR processor not initialized")] * len(images)
+        
+        return await asyncio.gather(
+            *(self._ocr_processor.extract_text_from_image(image) for image in images),
+            return_exceptions=True
+        )
     
     async def _initialize_ocr(self) -> None:
-        """Initialize OCR processor"""
-        # Would initialize Tesseract or other OCR engine
-        self._ocr_processor = OCRProcessor(language=self.config.ocr_language)
+        """Initialize OCR processor, reusing the current one on reconnect"""
+        # Check up front: an ImportError in the worker initializer would only
+        # surface as a BrokenProcessPool on the first OCR call
+        if importlib.util.find_spec("tesserocr") is None:
+            raise ProcessingError(
+                "OCR requires the 'tesserocr' package (install the 'vision' extra)"
+            )
+        
+        options = (self.config.ocr_language, self.config.max_workers, self.config.ocr_page_seg_mode)
+        if self._ocr_processor:
+            if self._ocr_processor.options == options:
+                return
+            # Settings changed - stop the old workers before starting new ones
+            await self._ocr_processor.close()
+            self._ocr_processor = None
+        
+        self._ocr_processor = OCRProcessor(
+            language=self.config.ocr_language,
+            max_workers=self.config.max_workers,
+            page_seg_mode=self.config.ocr_page_seg_mode
+        )
     
     # Schema and Metadata
     
     async def get_schema(self) -> Dict[str, Any]:
-        """Get schema information for discovered files"""
+        """Get schema information for discovered files
+        
+        The result is cached until discovery changes the file set; callers
+        get a copy, so mutating it leaves the cache intact.
+        """
         
         if not self.is_connected:
             await self.connect()
         
+        version = self._discovered_files.version
+        if self._schema_cache and self._schema_cache[0] == version:
+            return self._copy_schema(self._schema_cache[1])
+        
+        # Walk only the needed columns instead of materializing full rows
+        columns = self._discovered_files.columns
+        files = [
+            {
+                "name": name,
+                "path": path,
+                "type": file_type.value,
+                "size_mb": size_mb,
+                "modified": modified.isoformat()
+            }
+            for name, path, file_type, size_mb, modified in zip(
+                columns["name"], columns["path"], columns["file_type"],
+                columns["size_mb"], columns["modified"]
+            )
+        ]
+        
         schema_info = {
-            "total_files": len(self._discovered_files),
-            "file_types": {},
-            "files": []
+            "total_files": len(files),
+            "file_types": {
+                file_type.value: count
+                for file_type, count in self._discovered_files.type_counts().items()
+            },
+            "files": files
         }
         
-        # Count file types
-        for file_info in self._discovered_files:
-            file_type = file_info["file_type"].value
-            if file_type not in schema_info["file_types"]:
-                schema_info["file_types"][file_type] = 0
-            schema_info["file_types"][file_type] += 1
-            
-            schema_info["files"].append({
-                "name": file_info["name"],
-                "path": file_info["path"],
-                "type": file_type,
-                "size_mb": file_info["size_mb"],
-                "modified": file_info["modified"].isoformat()
-            })
-        
-        return schema_info
+        self._schema_cache = (version, schema_info)
+        return self._copy_schema(schema_info)
+    
+    @staticmethod
+    def _copy_schema(schema_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a schema dict down to its per-file entries (values are immutable)"""
+        return {
+            "total_files": schema_info["total_files"],
+            "file_types": dict(schema_info["file_types"]),
+            "files": [dict(file) for file in schema_info["files"]]
+        }
+
+
+# Tesseract engine of the current OCR worker process
+_ocr_api = None
+
+
+def _init_ocr_worker(language: str, page_seg_mode: int) -> None:
+    """Process pool initializer: load one Tesseract engine for this worker"""
+    global _ocr_api
+    
+    # One OpenMP thread per engine - parallelism comes from the worker
+    # processes, and letting each engine fan out oversubscribes the CPUs
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    
+    from tesserocr import PyTessBaseAPI
+    
+    # Kept open for the life of the worker; released when it exits
+    _ocr_api = PyTessBaseAPI(lang=language, psm=page_seg_mode)
+    atexit.register(_ocr_api.End)
+
+
+def _ocr_file(image_path: str) -> str:
+    _ocr_api.SetImageFile(image_path)
+    return _ocr_api.GetUTF8Text()
+
+
+def _ocr_image(image: Any) -> str:
+    _ocr_api.SetImage(image)
+    return _ocr_api.GetUTF8Text()
 
 
-# Placeholder for OCR processor
 class OCRProcessor:
-    def __init__(self, language: str = "eng"):
+    """
+    Tesseract OCR running in a pool of worker processes.
+    
+    Each worker loads a ``tesserocr.PyTessBaseAPI`` once in its initializer
+    and reuses it for every image, so the engine and language model are not
+    reloaded per image. Workers are limited to one OpenMP thread each and
+    use the ``spawn`` start method, so the limit is in place before
+    Tesseract is loaded and no event loop state is forked.
+    
+    Spawned workers re-import the parent's ``__main__`` module, so a script
+    that uses OCR without an ``if __name__ == "__main__":`` guard re-runs
+    its top-level code in every worker.
+    """
+    
+    def __init__(self, language: str = "eng", max_workers: int = 4, page_seg_mode: int = 6):
         self.language = language
+        self.page_seg_mode = page_seg_mode
+        # Settings the pool was started with, as (language, max_workers, page_seg_mode)
+        self.options = (language, max_workers, page_seg_mode)
+        self._executor = ProcessPoolExecutor(
+            max_workers=max(1, min(os.cpu_count() or 1, max_workers)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_ocr_worker,
+            initargs=(language, page_seg_mode)
+        )
     
     async def extract_text(self, image_path: str) -> str:
-        # Would implement actual OCR using Tesseract or similar
-        return "OCR text extraction not implemented yet"
\ No newline at end of file
+        """Extract text from an image file"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _ocr_file, image_path)
+    
+    async def extract_text_from_image(self, image: Any) -> str:
+        """Extract text from an in-memory PIL image"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _ocr_image, image)
+    
+    async def close(self) -> None:
+        """Stop the worker processes"""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
@@ -9,12 +9,19 @@ Advanced web connector supporting multiple automation modes:
 """
 
 import asyncio
+import base64
+import hashlib
+import re
+import time
+import weakref
+from collections import OrderedDict, deque
 from enum import Enum
-from typing import Any, Dict, List, Optional, AsyncGenerator, Union
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, AsyncGenerator, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+import orjson
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, CDPSession
 from pydantic import BaseModel, Field
 
 from .base import ConnectorInterface, ConnectorConfig, DataRecord, ConnectorStatus
@@ -22,6 +29,99 @@ from ..core.events import EventBus
 from ..core.exceptions import AutomationError, VisionError
 
 
+# Browser types exposed as launchers on the Playwright object
+SUPPORTED_BROWSERS = frozenset({"chromium", "firefox", "webkit"})
+
+# Action types that can change what a screenshot would show
+DOM_MUTATING_ACTIONS = frozenset({"click", "type", "navigate", "scroll"})
+
+# Upper bound (seconds) for the stream poll backoff after repeated failures,
+# raised to the poll interval when that is longer
+STREAM_MAX_BACKOFF = 300
+
+# Max number of validated workflows memoized per connector
+WORKFLOW_CACHE_SIZE = 128
+
+# Hybrid mode skips the traditional attempt once its success rate (an EMA
+# over at least MIN_SUCCESS_SAMPLES actions) drops below this threshold,
+# re-probing it every TRADITIONAL_REPROBE_INTERVAL skipped actions
+TRADITIONAL_SKIP_THRESHOLD = 0.2
+MIN_SUCCESS_SAMPLES = 10
+TRADITIONAL_REPROBE_INTERVAL = 10
+
+# URL patterns for resource types that can be blocked by extension alone, so
+# matching requests are aborted without a per-request Python callback.
+# Playwright applies them with re.search to the full URL, so each one is
+# anchored to the path - an extension in the query or fragment never matches
+_BLOCKED_RESOURCE_PATTERNS = {
+    "image": re.compile(r"^[^?#]*\.(?:png|jpe?g|gif|webp|avif|svg|ico|bmp)(?:[?#]|$)", re.IGNORECASE),
+    "font": re.compile(r"^[^?#]*\.(?:woff2?|ttf|otf|eot)(?:[?#]|$)", re.IGNORECASE),
+    "media": re.compile(r"^[^?#]*\.(?:mp4|webm|ogg|ogv|mp3|wav|m4a|mov|avi)(?:[?#]|$)", re.IGNORECASE),
+    "stylesheet": re.compile(r"^[^?#]*\.css(?:[?#]|$)", re.IGNORECASE),
+}
+
+# Shared prelude for the in-page scripts below: collects the document plus
+# every open shadow root, so CSS selectors pierce shadow DOM the way
+# Playwright's own CSS engine does.
+_ROOTS_JS = """
+    const roots = [document];
+    for (let i = 0; i < roots.length; i++) {
+        const walker = document.createTreeWalker(roots[i], NodeFilter.SHOW_ELEMENT);
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            if (node.shadowRoot) roots.push(node.shadowRoot);
+        }
+    }
+    const queryAll = (selector) => roots.flatMap((root) => Array.from(root.querySelectorAll(selector)));
+"""
+
+# Evaluated in the page: resolves every extraction rule in one roundtrip.
+# Rules the DOM APIs cannot handle (Playwright-specific selector engines)
+# come back as null and are resolved through Playwright instead.
+_EXTRACT_JS = """
+(rules) => {""" + _ROOTS_JS + """
+    const out = {};
+    for (const [field, selector] of Object.entries(rules)) {
+        try {
+            let nodes;
+            if (selector.startsWith("//") || selector.startsWith("xpath=")) {
+                const expr = selector.startsWith("xpath=") ? selector.slice(6) : selector;
+                const snapshot = document.evaluate(
+                    expr, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                );
+                nodes = Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+            } else {
+                nodes = queryAll(selector);
+            }
+            out[field] = nodes.map((node) => (node.textContent || "").trim());
+        } catch (e) {
+            out[field] = null;
+        }
+    }
+    return out;
+}
+"""
+
+# Evaluated in the page: counts matches per selector without creating handles
+_COUNT_JS = """
+(selectors) => {""" + _ROOTS_JS + """
+    return Object.fromEntries(selectors.map((selector) => [selector, queryAll(selector).length]));
+}
+"""
+
+# Evaluated in the page: reports which candidate selectors match anything
+_PROBE_JS = """
+(candidates) => {""" + _ROOTS_JS + """
+    return Object.fromEntries(candidates.map(([field, selector]) => {
+        try {
+            return [field, roots.some((root) => root.querySelector(selector) !== null)];
+        } catch (e) {
+            return [field, false];
+        }
+    }));
+}
+"""
+
+
 class WebAutomationMode(Enum):
     """Web automation execution modes"""
     TRADITIONAL = "traditional"      # Pure Playwright/Selenium
@@ -64,6 +164,7 @@ class WebConnectorConfig(ConnectorConfig):
     prefer_traditional: bool = True
     vision_fallback: bool = True
     learning_enabled: bool = False
+    learning_history_max: int = 10000  # Most recent actions kept for learning
     
     # Traditional automation settings
     default_timeout: int = 30000  # milliseconds
@@ -75,6 +176,7 @@ class WebConnectorConfig(ConnectorConfig):
     vision_model_size: str = "7B"    # for Qwen: 3B, 7B, 32B, 72B
     ai_timeout: int = 60
     screenshot_quality: int = 90
+    screenshot_ttl_ms: int = 200  # Reuse a screenshot of an unchanged page this long
     
     # Anti-detection
     stealth_mode: bool = True
@@ -84,10 +186,139 @@ class WebConnectorConfig(ConnectorConfig):
     
     # Performance
     parallel_instances: int = 1
+    context_pool_size: int = 8  # Max concurrent contexts on the shared browser
     resource_blocking: List[str] = Field(default=["images", "fonts", "media"])
     cache_enabled: bool = True
 
 
+async def _abort_route(route: Any) -> None:
+    """Route handler that blocks the request, letting page navigations through"""
+    if route.request.is_navigation_request():
+        await route.continue_()
+    else:
+        await route.abort()
+
+
+class _BrowserPool:
+    """
+    Process-wide pool of long-lived browsers shared by WebConnector instances.
+    
+    One browser is launched per (browser_type, headless, args) key and kept
+    running; connectors borrow isolated BrowserContexts from it, which is far
+    cheaper than launching Playwright and a browser for every connection.
+    
+    Each connector's own long-lived context is not counted against the cap;
+    only short-lived contexts opened with ``limited=True`` (concurrent
+    workflows) take one of ``size`` slots. The cap is the largest size
+    requested for the key.
+    
+    Pools are kept per event loop: Playwright objects and the slot semaphore
+    belong to the loop that created them, so a later ``asyncio.run`` gets
+    fresh pools and those of a closed loop are dropped with it.
+    """
+    
+    _pools: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, _BrowserPool]]"] = (
+        weakref.WeakKeyDictionary()
+    )
+    _locks: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]"] = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    def __init__(self, playwright: Any, browser: Browser, size: int):
+        self.playwright = playwright
+        self.browser = browser
+        self.size = size
+        self._slots = asyncio.Semaphore(size)
+        self._limited: "set[BrowserContext]" = set()
+    
+    def _grow(self, size: int) -> None:
+        """Raise the slot cap to size if it is larger than the current one"""
+        for _ in range(size - self.size):
+            self._slots.release()
+        self.size = max(self.size, size)
+    
+    @classmethod
+    async def acquire(
+        cls, 
+        key: Tuple, 
+        launch: Callable[[Any], Awaitable[Browser]], 
+        size: int
+    ) -> "_BrowserPool":
+        """Return the pool for key, launching its browser on first use"""
+        loop = asyncio.get_running_loop()
+        lock = cls._locks.get(loop)
+        if lock is None:
+            lock = cls._locks[loop] = asyncio.Lock()
+        pools = cls._pools.setdefault(loop, {})
+        
+        async with lock:
+            pool = pools.get(key)
+            if pool is None or not pool.browser.is_connected():
+                if pool is not None:
+                    await pool.playwright.stop()
+                playwright = await async_playwright().start()
+                try:
+                    browser = await launch(playwright)
+                except Exception:
+                    await playwright.stop()
+                    raise
+                pool = cls(playwright, browser, size)
+                pools[key] = pool
+            else:
+                pool._grow(size)
+            return pool
+    
+    async def new_context(
+        self, 
+        limited: bool = False, 
+        timeout: Optional[float] = None, 
+        **options: Any
+    ) -> BrowserContext:
+        """Open a new context
+        
+        A limited context first waits up to timeout seconds for a free slot
+        and raises AutomationError if none frees up in time.
+        """
+        if not limited:
+            return await self.browser.new_context(**options)
+        
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise AutomationError(
+                f"No browser context slot freed up within {timeout}s "
+                f"(context_pool_size={self.size})"
+            )
+        
+        try:
+            context = await self.browser.new_context(**options)
+        except Exception:
+            self._slots.release()
+            raise
+        
+        self._limited.add(context)
+        return context
+    
+    async def release_context(self, context: BrowserContext) -> None:
+        """Close a context and free its slot if it held one; the browser stays running"""
+        try:
+            await context.close()
+        finally:
+            if context in self._limited:
+                self._limited.discard(context)
+                self._slots.release()
+    
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close every browser pooled on the running loop and stop Playwright"""
+        pools = list(cls._pools.pop(asyncio.get_running_loop(), {}).values())
+        for pool in pools:
+            try:
+                await pool.browser.close()
+            finally:
+                await pool.playwright.stop()
+
+
 class WebConnector(ConnectorInterface):
     """
     Advanced web automation connector with multiple execution modes
@@ -100,9 +331,8 @@ class WebConnector(ConnectorInterface):
         super().__init__(config, event_bus)
         self.config: WebConnectorConfig = config
         
-        # Browser management
-        self._playwright = None
-        self._browser: Optional[Browser] = None
+        # Browser management (the browser itself is shared via _BrowserPool)
+        self._pool: Optional[_BrowserPool] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
         
@@ -110,9 +340,26 @@ class WebConnector(ConnectorInterface):
         self._vision_processor = None
         self._learning_engine = None
         
+        # Validated workflows keyed by query hash (LRU)
+        self._workflow_cache: "OrderedDict[str, List[WebWorkflow]]" = OrderedDict()
+        
+        # Last vision screenshot as (page, url, monotonic time, bytes)
+        self._last_screenshot: Optional[Tuple[Page, str, float, bytes]] = None
+        
+        # Long-lived CDP sessions per page (Chromium only), dropped with the page
+        self._cdp_sessions: "weakref.WeakKeyDictionary[Page, CDPSession]" = weakref.WeakKeyDictionary()
+        
         # Performance tracking
-        self._action_history: List[Dict] = []
+        self._action_history: "deque[Dict]" = deque(maxlen=self.config.learning_history_max)
+        self._learning_tasks: "set[asyncio.Task]" = set()
         self._success_rates: Dict[str, float] = {}
+        self._success_samples: Dict[str, int] = {}
+        self._traditional_skips = 0
+        
+        # Blocked Playwright resource types, normalized once ("images" -> "image")
+        self._blocked_types = frozenset(
+            resource_type.rstrip("s") for resource_type in self.config.resource_blocking or ()
+        )
     
     @property
     def connector_type(self) -> str:
@@ -125,41 +372,26 @@ class WebConnector(ConnectorInterface):
     # Connection Management
     
     async def connect(self) -> None:
-        """Initialize browser and establish connection"""
+        """Borrow a browser context and establish connection"""
         try:
             await self.set_status(ConnectorStatus.CONNECTING)
             
-            # Initialize Playwright
-            self._playwright = await async_playwright().start()
-            
-            # Launch browser
-            browser_args = {
-                "headless": self.config.headless,
-                "args": self._get_browser_args()
-            }
-            
-            if self.config.browser_type == "chromium":
-                self._browser = await self._playwright.chromium.launch(**browser_args)
-            elif self.config.browser_type == "firefox":
-                self._browser = await self._playwright.firefox.launch(**browser_args)
-            elif self.config.browser_type == "webkit":
-                self._browser = await self._playwright.webkit.launch(**browser_args)
-            else:
-                raise AutomationError(f"Unsupported browser: {self.config.browser_type}")
-            
-            # Create context
-            context_options = {
-                "viewport": self.config.viewport,
-                "user_agent": self.config.user_agent,
-            }
+            # Borrow the shared browser for this configuration
+            browser_args = self._get_browser_args()
+            self._pool = await _BrowserPool.acquire(
+                (self.config.browser_type, self.config.headless, tuple(browser_args)),
+                self._launch_browser,
+                self.config.context_pool_size
+            )
             
-            self._context = await self._browser.new_context(**context_options)
+            # Create an isolated context on it
+            self._context = await self._pool.new_context(**self._get_context_options())
             
             # Create page
             self._page = await self._context.new_page()
             
             # Configure page settings
-            await self._configure_page()
+            await self._configure_page(self._page)
             
             # Initialize AI components if needed
             if self.config.automation_mode in [WebAutomationMode.VISION_AI, WebAutomationMode.HYBRID]:
@@ -174,20 +406,13 @@ class WebConnector(ConnectorInterface):
             raise
     
     async def disconnect(self) -> None:
-        """Close browser and cleanup resources"""
+        """Release the browser context; the shared browser stays running"""
         try:
             if self._context:
-                await self._context.close()
+                await self._pool.release_context(self._context)
                 self._context = None
-                
-            if self._browser:
-                await self._browser.close()
-                self._browser = None
-                
-            if self._playwright:
-                await self._playwright.stop()
-                self._playwright = None
             
+            self._pool = None
             self._page = None
             
             await self.set_status(ConnectorStatus.DISCONNECTED)
@@ -195,6 +420,24 @@ class WebConnector(ConnectorInterface):
         except Exception as e:
             await self.handle_error(e, "disconnect")
     
+    @classmethod
+    async def aclose_pool(cls) -> None:
+        """Close the shared browsers; call once on application shutdown"""
+        await _BrowserPool.close_all()
+    
+    async def _launch_browser(self, playwright: Any) -> Browser:
+        """Launch the configured browser type"""
+        browser_args = {
+            "headless": self.config.headless,
+            "args": self._get_browser_args()
+        }
+        
+        if self.config.browser_type not in SUPPORTED_BROWSERS:
+            raise AutomationError(f"Unsupported browser: {self.config.browser_type}")
+        
+        launcher = getattr(playwright, self.config.browser_type)
+        return await launcher.launch(**browser_args)
+    
     # Data Operations
     
     async def fetch_data(
@@ -202,54 +445,110 @@ class WebConnector(ConnectorInterface):
         query: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None
     ) -> List[DataRecord]:
-        """Execute web workflow and extract data"""
+        """Execute web workflow(s) and extract data
+        
+        A query with several workflows (``workflows``) or URLs (``urls``) runs
+        them concurrently, each in its own pooled context, at most
+        ``parallel_instances`` at a time.
+        """
         
         if not self.is_connected:
             await self.connect()
         
-        workflow = self._parse_query_to_workflow(query)
+        workflows = self._parse_query_to_workflows(query)
         
         try:
-            results = []
+            if len(workflows) == 1:
+                return await self._run_workflow(self._page, workflows[0], limit)
             
-            # Navigate to start URL
-            await self._navigate(workflow.start_url)
+            semaphore = asyncio.Semaphore(self.config.parallel_instances)
+            pool = self._pool
             
-            # Execute workflow actions
-            for i, action in enumerate(workflow.actions):
-                success = await self._execute_action(action)
-                
-                if not success and not self.config.continue_on_error:
-                    raise AutomationError(f"Action {i+1} failed: {action.type}")
-                
-                # Check if we've hit the limit
-                if limit and len(results) >= limit:
-                    break
-            
-            # Extract data based on extraction rules
-            extracted_data = await self._extract_data(workflow.extraction_rules)
-            
-            # Convert to DataRecord format
-            for item in extracted_data:
-                record = DataRecord(
-                    id=None,
-                    data=item,
-                    metadata={
-                        "workflow": workflow.name,
-                        "url": self._page.url,
-                        "extraction_time": datetime.utcnow()
-                    },
-                    timestamp=datetime.utcnow(),
-                    source=f"web:{workflow.start_url}"
-                )
-                results.append(record)
+            async def run_isolated(workflow: WebWorkflow) -> List[DataRecord]:
+                async with semaphore:
+                    context = await pool.new_context(
+                        limited=True,
+                        timeout=self.config.default_timeout / 1000,
+                        **self._get_context_options()
+                    )
+                    try:
+                        page = await context.new_page()
+                        await self._configure_page(page)
+                        return await self._run_workflow(page, workflow, limit)
+                    finally:
+                        await pool.release_context(context)
             
-            return results
+            # Stop the sibling workflows (and free their contexts) if one fails
+            tasks = [asyncio.ensure_future(run_isolated(workflow)) for workflow in workflows]
+            try:
+                batches = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            results = [record for batch in batches for record in batch]
+            
+            return results[:limit] if limit else results
             
         except Exception as e:
             await self.handle_error(e, "fetch_data")
             raise
     
+    async def _run_workflow(
+        self, 
+        page: Page, 
+        workflow: WebWorkflow, 
+        limit: Optional[int]
+    ) -> List[DataRecord]:
+        """Run a single workflow on page and convert extracted data to records"""
+        
+        results = []
+        
+        # Navigate to start URL
+        await self._navigate(page, workflow.start_url)
+        
+        # Execute workflow actions
+        for i, action in enumerate(workflow.actions):
+            success = await self._execute_action(page, action)
+            
+            if not success and not self.config.continue_on_error:
+                raise AutomationError(f"Action {i+1} failed: {action.type}")
+            
+            # Check if we've hit the limit
+            if limit and len(results) >= limit:
+                break
+        
+        # Action-only workflows produce no records
+        if not workflow.extraction_rules:
+            return results
+        
+        # Extract data based on extraction rules
+        extracted_rows = await self._extract_data(page, workflow.extraction_rules)
+        if limit:
+            extracted_rows = extracted_rows[:limit]
+        
+        # Convert to DataRecord format, one record per extracted row; the
+        # per-workflow values are computed once rather than per record
+        now = datetime.utcnow()
+        url = page.url
+        source = f"web:{workflow.start_url}"
+        for item in extracted_rows:
+            record = DataRecord(
+                id=None,
+                data=item,
+                metadata={
+                    "workflow": workflow.name,
+                    "url": url,
+                    "extraction_time": now
+                },
+                timestamp=now,
+                source=source
+            )
+            results.append(record)
+        
+        return results
+    
     async def fetch_data_stream(
         self, 
         query: Optional[Dict[str, Any]] = None
@@ -259,26 +558,41 @@ class WebConnector(ConnectorInterface):
         # Implement streaming logic for continuous data extraction
         # This could involve periodic checks, WebSocket monitoring, etc.
         
-        workflow = self._parse_query_to_workflow(query)
-        interval = query.get("interval", 60) if query else 60
+        self._parse_query_to_workflows(query)  # Validate the query up front
+        interval = query.get("interval", 60)
+        batch_size = query.get("batch_size", 10)
+        
+        # Ticks are scheduled from a fixed origin so processing time does not
+        # push later polls back; failures back off exponentially instead,
+        # never retrying faster than the poll interval. Cancellation is not
+        # caught and ends the stream.
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        backoff = interval
+        max_backoff = max(STREAM_MAX_BACKOFF, interval)
         
         while True:
             try:
-                records = await self.fetch_data(query, limit=query.get("batch_size", 10))
-                
-                for record in records:
-                    yield record
-                
-                # Wait for next interval
-                await asyncio.sleep(interval)
-                
+                records = await self.fetch_data(query, limit=batch_size)
             except Exception as e:
                 await self.handle_error(e, "fetch_data_stream")
-                await asyncio.sleep(interval)  # Continue trying
+                await asyncio.sleep(backoff)
+                # Floor of 1s so a zero interval still backs off
+                backoff = min(max(backoff * 2, 1), max_backoff)
+                next_tick = loop.time()
+                continue
+            
+            backoff = interval
+            for record in records:
+                yield record
+            
+            # Wait for the next tick; if this batch overran it, poll right away
+            next_tick = max(next_tick + interval, loop.time())
+            await asyncio.sleep(next_tick - loop.time())
     
     # AI-Powered Automation Methods
     
-    async def _execute_action(self, action: WebAction) -> bool:
+    async def _execute_action(self, page: Page, action: WebAction) -> bool:
         """
         Execute action using the configured automation mode
         
@@ -287,15 +601,18 @@ class WebConnector(ConnectorInterface):
         """
         mode = self.config.automation_mode
         
+        if action.type in DOM_MUTATING_ACTIONS:
+            self._last_screenshot = None
+        
         try:
             if mode == WebAutomationMode.TRADITIONAL:
-                return await self._execute_traditional_action(action)
+                return await self._execute_traditional_action(page, action)
             elif mode == WebAutomationMode.VISION_AI:
-                return await self._execute_vision_action(action)
+                return await self._execute_vision_action(page, action)
             elif mode == WebAutomationMode.HYBRID:
-                return await self._execute_hybrid_action(action)
+                return await self._execute_hybrid_action(page, action)
             elif mode == WebAutomationMode.LEARNING:
-                return await self._execute_learning_action(action)
+                return await self._execute_learning_action(page, action)
             else:
                 raise AutomationError(f"Unsupported automation mode: {mode}")
         
@@ -303,24 +620,24 @@ class WebConnector(ConnectorInterface):
             await self.handle_error(e, f"execute_action:{action.type}")
             return False
     
-    async def _execute_traditional_action(self, action: WebAction) -> bool:
+    async def _execute_traditional_action(self, page: Page, action: WebAction) -> bool:
         """Execute action using traditional Playwright selectors"""
         
         try:
             if action.type == "click":
-                await self._page.click(action.target, timeout=action.timeout or self.config.default_timeout)
+                await page.click(action.target, timeout=action.timeout or self.config.default_timeout)
             
             elif action.type == "type":
-                await self._page.fill(action.target, action.value)
+                await page.fill(action.target, action.value)
             
             elif action.type == "navigate":
-                await self._page.goto(action.target)
+                await page.goto(action.target)
             
             elif action.type == "wait":
-                await self._page.wait_for_selector(action.target)
+                await page.wait_for_selector(action.target)
             
             elif action.type == "scroll":
-                await self._page.evaluate(f"window.scrollTo(0, {action.value or 0})")
+                await page.evaluate(f"window.scrollTo(0, {action.value or 0})")
             
             else:
                 raise AutomationError(f"Unsupported action type: {action.type}")
@@ -330,27 +647,28 @@ class WebConnector(ConnectorInterface):
         except Exception:
             return False
     
-    async def _execute_vision_action(self, action: WebAction) -> bool:
+    async def _execute_vision_action(self, page: Page, action: WebAction) -> bool:
         """Execute action using Vision LLM"""
         
         if not self._vision_processor:
             await self._initialize_ai_components()
         
         try:
-            # Take screenshot
-            screenshot = await self._page.screenshot(quality=self.config.screenshot_quality)
+            # Take screenshot (or reuse one of the unchanged page)
+            screenshot = await self._capture_screenshot(page)
             
             # Use Vision LLM to understand and execute action
             result = await self._vision_processor.execute_action(
                 screenshot=screenshot,
                 action_description=f"{action.type} {action.target or action.value or ''}",
-                page_context=await self._get_page_context()
+                page_context=await self._get_page_context(page)
             )
             
             if result.get("success"):
                 # Execute the coordinates or instructions returned by Vision LLM
                 if result.get("coordinates"):
-                    await self._page.click(result["coordinates"][0], result["coordinates"][1])
+                    self._last_screenshot = None
+                    await page.click(result["coordinates"][0], result["coordinates"][1])
                 
                 return True
             
@@ -359,12 +677,12 @@ class WebConnector(ConnectorInterface):
         except Exception:
             return False
     
-    async def _execute_hybrid_action(self, action: WebAction) -> bool:
+    async def _execute_hybrid_action(self, page: Page, action: WebAction) -> bool:
         """Execute action with intelligent fallback between traditional and AI"""
         
         # Try traditional first (faster and more reliable when it works)
-        if self.config.prefer_traditional and action.target:
-            success = await self._execute_traditional_action(action)
+        if self.config.prefer_traditional and action.target and self._should_try_traditional():
+            success = await self._execute_traditional_action(page, action)
             if success:
                 self._update_success_rate("traditional", True)
                 return True
@@ -373,31 +691,44 @@ class WebConnector(ConnectorInterface):
         
         # Fallback to Vision AI if traditional failed or not preferred
         if self.config.vision_fallback:
-            success = await self._execute_vision_action(action)
+            success = await self._execute_vision_action(page, action)
             self._update_success_rate("vision_ai", success)
             return success
         
         return False
     
-    async def _execute_learning_action(self, action: WebAction) -> bool:
+    async def _execute_learning_action(self, page: Page, action: WebAction) -> bool:
         """Execute action with self-learning capabilities"""
         
         # This would implement more sophisticated learning logic
         # For now, use hybrid approach with learning tracking
         
-        success = await self._execute_hybrid_action(action)
+        success = await self._execute_hybrid_action(page, action)
         
-        # Track action for learning
-        self._action_history.append({
-            "action": action.dict(),
+        # Track action for learning - keep the model itself and the (sync)
+        # page URL; serialization is deferred until the entry is consumed
+        entry = {
+            "action": action,
             "success": success,
             "timestamp": datetime.utcnow(),
-            "page_url": self._page.url,
-            "page_context": await self._get_page_context()
-        })
+            "page_url": page.url
+        }
+        self._action_history.append(entry)
+        
+        if self._learning_engine:
+            task = asyncio.create_task(self._learn_from_action(entry))
+            self._learning_tasks.add(task)
+            task.add_done_callback(self._learning_tasks.discard)
         
         return success
     
+    async def _learn_from_action(self, entry: Dict[str, Any]) -> None:
+        """Hand a tracked action to the learning engine off the action path"""
+        try:
+            await self._learning_engine.learn_from_action({**entry, "action": entry["action"].dict()})
+        except Exception as e:
+            await self.handle_error(e, "learn_from_action")
+    
     # Helper Methods
     
     def _parse_query_to_workflow(self, query: Optional[Dict[str, Any]]) -> WebWorkflow:
@@ -424,47 +755,160 @@ class WebConnector(ConnectorInterface):
         else:
             raise AutomationError("Invalid query format")
     
-    async def _navigate(self, url: str) -> None:
-        """Navigate to URL with error handling"""
-        await self._page.goto(url, timeout=self.config.navigation_timeout)
+    def _parse_query_to_workflows(self, query: Optional[Dict[str, Any]]) -> List[WebWorkflow]:
+        """Convert query parameters to one or more WebWorkflows
         
-        # Wait for page to be ready
-        await self._page.wait_for_load_state("domcontentloaded")
+        Validated workflows are memoized by query content, so repeated polls
+        with the same query skip pydantic validation of every action.
+        """
+        
+        if not query:
+            return [self._parse_query_to_workflow(query)]
+        
+        key = hashlib.blake2b(
+            orjson.dumps(query, option=orjson.OPT_SORT_KEYS, default=str),
+            digest_size=16
+        ).hexdigest()
+        
+        workflows = self._workflow_cache.get(key)
+        if workflows is not None:
+            self._workflow_cache.move_to_end(key)
+            return workflows
+        
+        workflows = self._build_workflows(query)
+        self._workflow_cache[key] = workflows
+        if len(self._workflow_cache) > WORKFLOW_CACHE_SIZE:
+            self._workflow_cache.popitem(last=False)
+        
+        return workflows
     
-    async def _extract_data(self, extraction_rules: Dict[str, str]) -> List[Dict[str, Any]]:
-        """Extract data using CSS selectors or XPath"""
+    def _build_workflows(self, query: Dict[str, Any]) -> List[WebWorkflow]:
+        """Validate query parameters into WebWorkflows"""
         
-        results = []
+        if "workflows" in query:
+            return [WebWorkflow(**workflow_data) for workflow_data in query["workflows"]]
+        
+        if "urls" in query:
+            return [
+                WebWorkflow(
+                    name="simple_extraction",
+                    start_url=url,
+                    actions=[],
+                    extraction_rules=query.get("extract", {})
+                )
+                for url in query["urls"]
+            ]
+        
+        return [self._parse_query_to_workflow(query)]
+    
+    async def _navigate(self, page: Page, url: str) -> None:
+        """Navigate to URL with error handling"""
+        self._last_screenshot = None
+        await page.goto(
+            url,
+            timeout=self.config.navigation_timeout,
+            wait_until="domcontentloaded"
+        )
+    
+    async def _extract_data(self, page: Page, extraction_rules: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Extract data using CSS selectors or XPath
+        
+        When every rule matches the same number of elements the columns are
+        zipped into one row per element. Otherwise a single row holds each
+        field's value (unwrapped when it matched exactly once) or list.
+        """
+        
+        if not extraction_rules:
+            return []
         
+        try:
+            extracted = await page.evaluate(_EXTRACT_JS, extraction_rules)
+        except Exception as e:
+            await self.handle_error(e, "extract_data")
+            extracted = {}
+        
+        columns: Dict[str, Optional[List[str]]] = {}
         for field_name, selector in extraction_rules.items():
-            try:
-                elements = await self._page.query_selector_all(selector)
-                values = []
-                
-                for element in elements:
-                    text = await element.text_content()
-                    values.append(text.strip() if text else "")
-                
-                # If single value, don't wrap in array
-                if len(values) == 1:
-                    results.append({field_name: values[0]})
-                else:
-                    results.append({field_name: values})
-                    
-            except Exception as e:
-                await self.handle_error(e, f"extract_data:{field_name}")
-                results.append({field_name: None})
+            values = extracted.get(field_name)
+            
+            if values is None:
+                # Selector needs a Playwright engine; resolve it element by element
+                try:
+                    values = []
+                    for element in await page.query_selector_all(selector):
+                        text = await element.text_content()
+                        values.append(text.strip() if text else "")
+                except Exception as e:
+                    await self.handle_error(e, f"extract_data:{field_name}")
+                    values = None
+            
+            columns[field_name] = values
         
-        return results
+        lengths = {len(values) if values is not None else -1 for values in columns.values()}
+        if len(lengths) == 1 and lengths.pop() > 0:
+            fields = list(columns)
+            return [dict(zip(fields, row)) for row in zip(*columns.values())]
+        
+        # Ragged or failed columns - keep them together in a single row
+        return [{
+            field_name: values[0] if values is not None and len(values) == 1 else values
+            for field_name, values in columns.items()
+        }]
     
-    async def _get_page_context(self) -> Dict[str, Any]:
+    async def _capture_screenshot(self, page: Page) -> bytes:
+        """Take a JPEG viewport screenshot, reusing a recent one of the same page
+        
+        The cache is dropped whenever an action may have changed the page.
+        """
+        now = time.monotonic()
+        url = page.url
+        
+        if self._last_screenshot:
+            cached_page, cached_url, taken_at, screenshot = self._last_screenshot
+            if (
+                cached_page is page
+                and cached_url == url
+                and (now - taken_at) * 1000 < self.config.screenshot_ttl_ms
+            ):
+                return screenshot
+        
+        if self.config.browser_type == "chromium":
+            # Capture over a reused CDP session instead of the page.screenshot wrapper
+            session = self._cdp_sessions.get(page)
+            if session is None:
+                session = await page.context.new_cdp_session(page)
+                self._cdp_sessions[page] = session
+            
+            result = await session.send(
+                "Page.captureScreenshot",
+                {"format": "jpeg", "quality": self.config.screenshot_quality}
+            )
+            screenshot = base64.b64decode(result["data"])
+        else:
+            screenshot = await page.screenshot(
+                type="jpeg",
+                quality=self.config.screenshot_quality,
+                full_page=False
+            )
+        
+        self._last_screenshot = (page, url, now, screenshot)
+        return screenshot
+    
+    async def _get_page_context(self, page: Page) -> Dict[str, Any]:
         """Get current page context for AI processing"""
         return {
-            "url": self._page.url,
-            "title": await self._page.title(),
+            "url": page.url,
+            "title": await page.title(),
             "viewport": self.config.viewport
         }
     
+    def _get_context_options(self) -> Dict[str, Any]:
+        """Get browser context options"""
+        return {
+            "viewport": self.config.viewport,
+            "user_agent": self.config.user_agent,
+        }
+    
     def _get_browser_args(self) -> List[str]:
         """Get browser launch arguments"""
         args = []
@@ -479,22 +923,32 @@ class WebConnector(ConnectorInterface):
         
         return args
     
-    async def _configure_page(self) -> None:
+    async def _configure_page(self, page: Page) -> None:
         """Configure page settings"""
         
-        # Block resources if specified
-        if self.config.resource_blocking:
-            await self._page.route("**/*", self._handle_route)
+        # Block resources if specified - known types by URL pattern, anything
+        # else through the per-request resource type callback
+        if self._blocked_types:
+            needs_callback = False
+            for resource_type in self._blocked_types:
+                pattern = _BLOCKED_RESOURCE_PATTERNS.get(resource_type)
+                if pattern:
+                    await page.route(pattern, _abort_route)
+                else:
+                    needs_callback = True
+            
+            if needs_callback:
+                await page.route("**/*", self._handle_route)
         
         # Set extra headers for stealth
         if self.config.stealth_mode:
-            await self._page.set_extra_http_headers({
+            await page.set_extra_http_headers({
                 "Accept-Language": "en-US,en;q=0.9"
             })
     
     async def _handle_route(self, route):
         """Handle resource blocking"""
-        if route.request.resource_type in self.config.resource_blocking:
+        if route.request.resource_type in self._blocked_types:
             await route.abort()
         else:
             await route.continue_()
@@ -513,14 +967,34 @@ class WebConnector(ConnectorInterface):
     
     def _update_success_rate(self, method: str, success: bool) -> None:
         """Update success rate tracking"""
-        if method not in self._success_rates:
-            self._success_rates[method] = 0.0
+        target = 1.0 if success else 0.0
+        samples = self._success_samples.get(method, 0) + 1
+        self._success_samples[method] = samples
+        
+        if samples == 1:
+            # Seed with the first observation instead of biasing towards 0
+            self._success_rates[method] = target
+            return
         
         # Simple exponential moving average
         alpha = 0.1
         current_rate = self._success_rates[method]
-        new_rate = current_rate + alpha * (1.0 if success else 0.0 - current_rate)
-        self._success_rates[method] = new_rate
+        self._success_rates[method] = current_rate + alpha * (target - current_rate)
+    
+    def _should_try_traditional(self) -> bool:
+        """Whether hybrid mode should attempt the traditional path first"""
+        if not self.config.vision_fallback:
+            return True
+        
+        if self._success_samples.get("traditional", 0) < MIN_SUCCESS_SAMPLES:
+            return True
+        
+        if self._success_rates["traditional"] >= TRADITIONAL_SKIP_THRESHOLD:
+            return True
+        
+        # Occasionally re-probe so the rate can recover when pages change
+        self._traditional_skips += 1
+        return self._traditional_skips % TRADITIONAL_REPROBE_INTERVAL == 0
     
     # Schema and Metadata
     
@@ -531,18 +1005,21 @@ class WebConnector(ConnectorInterface):
             return {"error": "Not connected"}
         
         try:
-            # Extract basic page structure
-            forms = await self._page.query_selector_all("form")
-            inputs = await self._page.query_selector_all("input")
-            links = await self._page.query_selector_all("a")
+            # Extract basic page structure; the probes are independent, so
+            # issue them concurrently instead of one roundtrip after another
+            counts, title, extractable_fields = await asyncio.gather(
+                self._page.evaluate(_COUNT_JS, ["form", "input", "a"]),
+                self._page.title(),
+                self._discover_extractable_fields()
+            )
             
             return {
                 "url": self._page.url,
-                "title": await self._page.title(),
-                "forms": len(forms),
-                "inputs": len(inputs),
-                "links": len(links),
-                "extractable_fields": await self._discover_extractable_fields()
+                "title": title,
+                "forms": counts["form"],
+                "inputs": counts["input"],
+                "links": counts["a"],
+                "extractable_fields": extractable_fields
             }
             
         except Exception as e:
@@ -552,8 +1029,6 @@ class WebConnector(ConnectorInterface):
         """Automatically discover extractable fields on the page"""
         
         # Simple heuristic-based field discovery
-        fields = {}
-        
         # Look for common data patterns
         candidates = [
             ("titles", "h1, h2, h3, .title, .heading"),
@@ -563,15 +1038,13 @@ class WebConnector(ConnectorInterface):
             ("links", "a[href]"),
         ]
         
-        for field_name, selector in candidates:
-            try:
-                elements = await self._page.query_selector_all(selector)
-                if elements:
-                    fields[field_name] = selector
-            except:
-                continue
+        # Probe all candidates in a single roundtrip
+        try:
+            present = await self._page.evaluate(_PROBE_JS, candidates)
+        except Exception:
+            return {}
         
-        return fields
+        return {field_name: selector for field_name, selector in candidates if present.get(field_name)}
 
 
 # Placeholder classes for AI components
@@ -11,14 +11,22 @@ Main orchestration engine that coordinates all ProcessIQ components:
 import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
-from .config import Settings, get_settings
+from .config import get_settings
 from .events import EventBus
 from .exceptions import ProcessIQError
 from .plugin_manager import PluginManager
-from .workflow_engine import WorkflowExecutor, create_workflow_executor
-from .security_features import SecurityFeatures, create_security_features
+
+if TYPE_CHECKING:
+    from .config import Settings
+    from .workflow_engine import WorkflowExecutor
+    from .security_features import SecurityFeatures
+
+
+# Shared read-only payload for lifecycle events that carry no data
+_EMPTY_PAYLOAD = MappingProxyType({})
 
 
 class ProcessIQEngine:
@@ -32,16 +40,30 @@ class ProcessIQEngine:
     - Manage resources and connections
     """
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(self, settings: Optional["Settings"] = None):
+        # Workflow and security services are only imported once an engine
+        # is built, keeping them off the import path of this module
+        from .workflow_engine import create_workflow_executor
+        from .security_features import create_security_features
+        
         self.settings = settings or get_settings()
         self.event_bus = EventBus()
         self.plugin_manager = PluginManager(self.event_bus)
-        self.workflow_executor = create_workflow_executor(self.event_bus)
-        self.security_features = create_security_features(self.event_bus)
+        self.workflow_executor: "WorkflowExecutor" = create_workflow_executor(self.event_bus)
+        self.security_features: "SecurityFeatures" = create_security_features(self.event_bus)
         
         self._initialized = False
         self._running = False
         self._tasks: List[asyncio.Task] = []
+        
+        # Lifecycle event payload that only depends on settings
+        self._version_payload = MappingProxyType({"version": self.settings.version})
+        
+        # Directories already created/checked by this engine
+        self._validated_dirs: Set[str] = set()
+        
+        # Path objects for configured directories, keyed by the setting value
+        self._paths: Dict[str, Path] = {}
     
     @property
     def is_initialized(self) -> bool:
@@ -66,15 +88,21 @@ class ProcessIQEngine:
             return
         
         try:
-            await self.event_bus.emit("engine.initializing", {
-                "version": self.settings.version
-            })
-            
-            # Validate configuration
-            await self._validate_configuration()
+            await self.event_bus.emit("engine.initializing", self._version_payload)
             
-            # Initialize core services
-            await self._initialize_core_services()
+            # Validate configuration and initialize core services; the two
+            # are independent, so run them concurrently
+            steps = [
+                asyncio.ensure_future(self._validate_configuration()),
+                asyncio.ensure_future(self._initialize_core_services())
+            ]
+            try:
+                await asyncio.gather(*steps)
+            finally:
+                # If one step failed, don't leave the other running behind us
+                for step in steps:
+                    step.cancel()
+                await asyncio.gather(*steps, return_exceptions=True)
             
             # Load plugins
             await self._load_plugins()
@@ -115,7 +143,7 @@ class ProcessIQEngine:
             return
         
         try:
-            await self.event_bus.emit("engine.shutting_down", {})
+            await self.event_bus.emit("engine.shutting_down", _EMPTY_PAYLOAD)
             
             # Stop background tasks
             await self._stop_background_tasks()
@@ -128,7 +156,7 @@ class ProcessIQEngine:
             
             self._running = False
             
-            await self.event_bus.emit("engine.shutdown_complete", {})
+            await self.event_bus.emit("engine.shutdown_complete", _EMPTY_PAYLOAD)
             
         except Exception as e:
             await self.event_bus.emit("engine.shutdown_failed", {
@@ -138,7 +166,7 @@ class ProcessIQEngine:
     
     async def reload_plugins(self) -> None:
         """Reload all plugins (useful for development)"""
-        await self.event_bus.emit("engine.reloading_plugins", {})
+        await self.event_bus.emit("engine.reloading_plugins", _EMPTY_PAYLOAD)
         
         # Cleanup existing plugins
         await self.plugin_manager.cleanup_all_plugins()
@@ -222,8 +250,8 @@ class ProcessIQEngine:
             },
             "plugins": {
                 "total": len(plugins_info),
-                "initialized": sum(1 for p in plugins_info.values() if p["initialized"]),
-                "enabled": sum(1 for p in plugins_info.values() if p["enabled"]),
+                "initialized": self.plugin_manager.initialized_count,
+                "enabled": self.plugin_manager.enabled_count,
                 "details": plugins_info
             },
             "events": {
@@ -241,17 +269,23 @@ class ProcessIQEngine:
     
     async def _validate_configuration(self) -> None:
         """Validate system configuration"""
-        # Check required directories
-        plugin_dir = Path(self.settings.plugin_directory)
-        data_dir = Path(self.settings.storage.data_directory)
-        
-        plugin_dir.mkdir(parents=True, exist_ok=True)
-        data_dir.mkdir(parents=True, exist_ok=True)
+        # Check required directories (once per engine)
+        for directory in (self.settings.plugin_directory, self.settings.storage.data_directory):
+            if directory not in self._validated_dirs:
+                await asyncio.to_thread(self._get_path(directory).mkdir, parents=True, exist_ok=True)
+                self._validated_dirs.add(directory)
         
         # Validate AI configuration if needed
         if not self.settings.validate_ai_setup():
             print("Warning: No AI services configured. Some features may be limited.")
     
+    def _get_path(self, directory: str) -> Path:
+        """Path for a configured directory, built once per distinct value"""
+        path = self._paths.get(directory)
+        if path is None:
+            path = self._paths[directory] = Path(directory)
+        return path
+    
     async def _initialize_core_services(self) -> None:
         """Initialize core system services"""
         # In a full implementation, this would:
@@ -263,7 +297,7 @@ class ProcessIQEngine:
     
     async def _load_plugins(self) -> None:
         """Load plugins from plugin directory"""
-        plugin_dir = Path(self.settings.plugin_directory)
+        plugin_dir = self._get_path(self.settings.plugin_directory)
         
         if plugin_dir.exists():
             try:
@@ -280,13 +314,14 @@ class ProcessIQEngine:
     
     async def _stop_background_tasks(self) -> None:
         """Stop all background tasks"""
-        for task in self._tasks:
-            task.cancel()
-        
-        if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+        # Detach the list first so tasks started while we wait are kept
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
         
-        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     async def _cleanup_core_services(self) -> None:
         """Cleanup core services"""
@@ -305,9 +340,7 @@ class ProcessIQEngine:
             return
         
         try:
-            await self.event_bus.emit("engine.shutting_down", {
-                "version": self.settings.version
-            })
+            await self.event_bus.emit("engine.shutting_down", self._version_payload)
             
             # Stop background tasks
             await self._stop_background_tasks()
@@ -321,7 +354,7 @@ class ProcessIQEngine:
             self._running = False
             self._initialized = False
             
-            await self.event_bus.emit("engine.shutdown", {})
+            await self.event_bus.emit("engine.shutdown", _EMPTY_PAYLOAD)
             
         except Exception as e:
             print(f"Error during engine cleanup: {e}")
@@ -342,7 +375,7 @@ class ProcessIQEngine:
 
 # Convenience functions for common use cases
 
-async def create_engine(settings: Optional[Settings] = None) -> ProcessIQEngine:
+async def create_engine(settings: Optional["Settings"] = None) -> ProcessIQEngine:
     """Create and initialize a ProcessIQ engine"""
     engine = ProcessIQEngine(settings)
     await engine.initialize()
@@ -9,7 +9,7 @@ Provides pub/sub event system for loose coupling between components:
 """
 
 import asyncio
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -80,26 +80,52 @@ class EventBus:
             timestamp=datetime.utcnow(),
             source=source
         )
+        await self._publish([event])
+    
+    async def emit_many(
+        self, 
+        events: List[Tuple[str, Dict[str, Any]]], 
+        source: str = "system"
+    ) -> None:
+        """Emit a batch of events to all subscribers
+        
+        Sync handlers run in event order; the async handlers of the whole
+        batch are awaited together in a single gather.
+        """
+        
+        if not events:
+            return
+        
+        timestamp = datetime.utcnow()
+        await self._publish([
+            Event(name=event_name, data=data, timestamp=timestamp, source=source)
+            for event_name, data in events
+        ])
+    
+    async def _publish(self, events: List[Event]) -> None:
+        """Record events in history and dispatch them to their handlers"""
         
         # Store in history
-        self._add_to_history(event)
+        self._add_to_history(events)
         
-        # Call sync handlers
-        handlers = self._handlers.get(event_name, [])
-        for handler in handlers:
-            try:
-                handler(event)
-            except Exception as e:
-                # Log error but don't stop other handlers
-                print(f"Error in event handler: {e}")
+        # Call sync handlers, collecting the async handler calls
+        pending = []
+        for event in events:
+            for handler in self._handlers.get(event.name, []):
+                try:
+                    handler(event)
+                except Exception as e:
+                    # Log error but don't stop other handlers
+                    print(f"Error in event handler: {e}")
+            
+            pending.extend(
+                self._safe_async_call(handler, event)
+                for handler in self._async_handlers.get(event.name, [])
+            )
         
         # Call async handlers
-        async_handlers = self._async_handlers.get(event_name, [])
-        if async_handlers:
-            await asyncio.gather(*[
-                self._safe_async_call(handler, event) 
-                for handler in async_handlers
-            ], return_exceptions=True)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
     
     async def _safe_async_call(self, handler: AsyncEventHandler, event: Event) -> None:
         """Safely call async handler with error handling"""
@@ -109,11 +135,12 @@ class EventBus:
             # Log error but don't propagate
             print(f"Error in async event handler: {e}")
     
-    def _add_to_history(self, event: Event) -> None:
-        """Add event to history with size limit"""
-        self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
+    def _add_to_history(self, events: List[Event]) -> None:
+        """Add events to history with size limit"""
+        self._event_history.extend(events)
+        overflow = len(self._event_history) - self._max_history
+        if overflow > 0:
+            del self._event_history[:overflow]
     
     def get_recent_events(self, count: int = 10) -> List[Event]:
         """Get recent events from history"""
@@ -4,11 +4,20 @@ ProcessIQ Exception Hierarchy
 Provides structured error handling across the ProcessIQ platform.
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+
+# Shared read-only details for errors raised without any
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class ProcessIQError(Exception):
-    """Base exception for all ProcessIQ errors"""
+    """Base exception for all ProcessIQ errors
+    
+    ``details`` is the dict passed in, or a shared read-only empty mapping
+    when none was given.
+    """
     
     def __init__(
         self, 
@@ -18,8 +27,17 @@ class ProcessIQError(Exception):
     ):
         self.message = message
         self.error_code = error_code
-        self.details = details or {}
+        self._details = details
         super().__init__(self.message)
+    
+    @property
+    def details(self) -> Mapping[str, Any]:
+        # Stored as None when absent, which also keeps the error picklable
+        return self._details if self._details is not None else _EMPTY_DETAILS
+    
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._details = value
 
 
 class ConfigurationError(ProcessIQError):
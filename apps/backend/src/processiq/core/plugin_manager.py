@@ -12,7 +12,7 @@ import importlib
 import inspect
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Set, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
@@ -38,6 +38,8 @@ class PluginInterface(ABC):
         self.config = config
         self.event_bus = event_bus
         self._initialized = False
+        # Registry holding this plugin, told when it becomes initialized
+        self._registry: Optional["PluginRegistry"] = None
     
     @property
     @abstractmethod
@@ -60,7 +62,11 @@ class PluginInterface(ABC):
         return self._initialized
     
     def _mark_initialized(self) -> None:
+        if self._initialized:
+            return
         self._initialized = True
+        if self._registry is not None:
+            self._registry.mark_initialized(self.config.name)
 
 
 P = TypeVar('P', bound=PluginInterface)
@@ -71,7 +77,28 @@ class PluginRegistry:
     
     def __init__(self):
         self._plugins: Dict[str, PluginInterface] = {}
-        self._plugin_types: Dict[str, List[str]] = {}
+        # Plugins grouped by type, in registration order
+        self._plugin_types: Dict[str, List[PluginInterface]] = {}
+        
+        # Names of initialized plugins, kept up to date on register/unregister
+        # and as plugins mark themselves initialized
+        self._initialized_names: Set[str] = set()
+    
+    @property
+    def initialized_count(self) -> int:
+        """Number of registered plugins that are initialized"""
+        return len(self._initialized_names)
+    
+    @property
+    def enabled_count(self) -> int:
+        """Number of registered plugins with an enabled config"""
+        # Read off the configs so later changes to ``enabled`` are reflected
+        return sum(1 for plugin in self._plugins.values() if plugin.config.enabled)
+    
+    def mark_initialized(self, name: str) -> None:
+        """Record that a registered plugin is initialized; repeat calls are no-ops"""
+        if name in self._plugins:
+            self._initialized_names.add(name)
     
     def register(self, plugin: PluginInterface) -> None:
         """Register a plugin instance"""
@@ -82,10 +109,11 @@ class PluginRegistry:
             raise PluginError(f"Plugin '{name}' is already registered")
         
         self._plugins[name] = plugin
+        self._plugin_types.setdefault(plugin_type, []).append(plugin)
         
-        if plugin_type not in self._plugin_types:
-            self._plugin_types[plugin_type] = []
-        self._plugin_types[plugin_type].append(name)
+        plugin._registry = self
+        if plugin.is_initialized:
+            self.mark_initialized(name)
     
     def get(self, name: str) -> Optional[PluginInterface]:
         """Get plugin by name"""
@@ -93,8 +121,7 @@ class PluginRegistry:
     
     def get_by_type(self, plugin_type: str) -> List[PluginInterface]:
         """Get all plugins of a specific type"""
-        plugin_names = self._plugin_types.get(plugin_type, [])
-        return [self._plugins[name] for name in plugin_names]
+        return list(self._plugin_types.get(plugin_type, ()))
     
     def list_all(self) -> Dict[str, PluginInterface]:
         """Get all registered plugins"""
@@ -106,7 +133,10 @@ class PluginRegistry:
         if plugin:
             plugin_type = plugin.plugin_type
             if plugin_type in self._plugin_types:
-                self._plugin_types[plugin_type].remove(name)
+                self._plugin_types[plugin_type].remove(plugin)
+            
+            plugin._registry = None
+            self._initialized_names.discard(name)
         return plugin
 
 
@@ -163,6 +193,16 @@ class PluginManager:
         self.loader = PluginLoader()
         self._plugin_configs: Dict[str, PluginConfig] = {}
     
+    @property
+    def initialized_count(self) -> int:
+        """Number of registered plugins that are initialized"""
+        return self.registry.initialized_count
+    
+    @property
+    def enabled_count(self) -> int:
+        """Number of registered plugins with an enabled config"""
+        return self.registry.enabled_count
+    
     def load_plugin_config(self, config_path: Union[str, Path]) -> PluginConfig:
         """Load plugin configuration from file"""
         # Implementation would load from YAML/JSON
@@ -195,26 +235,43 @@ class PluginManager:
     
     async def initialize_plugin(self, plugin_name: str) -> None:
         """Initialize a specific plugin"""
+        payload = await self._initialize_plugin(plugin_name)
+        
+        # Emit event
+        if payload:
+            await self.event_bus.emit("plugin.initialized", payload)
+    
+    async def _initialize_plugin(self, plugin_name: str) -> Optional[Dict[str, Any]]:
+        """Initialize a plugin, returning its event payload if it was initialized now"""
         plugin = self.registry.get(plugin_name)
         if not plugin:
             raise PluginError(f"Plugin '{plugin_name}' not found")
         
         if plugin.is_initialized:
-            return
+            return None
         
         await plugin.initialize()
         plugin._mark_initialized()
         
-        # Emit event
-        await self.event_bus.emit("plugin.initialized", {
+        return {
             "plugin_name": plugin_name,
             "plugin_type": plugin.plugin_type
-        })
+        }
     
     async def initialize_all_plugins(self) -> None:
-        """Initialize all registered plugins"""
-        for plugin_name in self.registry.list_all():
-            await self.initialize_plugin(plugin_name)
+        """Initialize all registered plugins
+        
+        The ``plugin.initialized`` events are emitted as one batch once the
+        plugins are up (including those initialized before a failure).
+        """
+        events = []
+        try:
+            for plugin_name in self.registry.list_all():
+                payload = await self._initialize_plugin(plugin_name)
+                if payload:
+                    events.append(("plugin.initialized", payload))
+        finally:
+            await self.event_bus.emit_many(events)
     
     async def cleanup_plugin(self, plugin_name: str) -> None:
         """Cleanup a specific plugin"""
@@ -67,6 +67,10 @@ async def lifespan(app: FastAPI):
         
     await event_bus.stop()
     await engine.cleanup()
+    
+    # Close browsers shared by web connectors
+    from .connectors.web import WebConnector
+    await WebConnector.aclose_pool()
 
 
 # Create FastAPI app
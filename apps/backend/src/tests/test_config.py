@@ -0,0 +1,68 @@
+"""Tests for application settings"""
+
+from processiq.core.config import DatabaseConfig, EnvironmentKind, Settings
+
+
+class TestEnvironment:
+    def test_kind_resolved_from_field(self):
+        settings = Settings(environment="Dev")
+
+        assert settings.environment_kind is EnvironmentKind.DEVELOPMENT
+        assert settings.is_development()
+        assert not settings.is_production()
+
+    def test_assignment_updates_kind(self):
+        settings = Settings(environment="development")
+
+        settings.environment = "production"
+        assert settings.is_production()
+        assert not settings.is_development()
+
+        settings.environment = "staging"
+        assert settings.environment_kind is EnvironmentKind.OTHER
+        assert not settings.is_production()
+        assert not settings.is_development()
+
+
+class TestLazySubConfigs:
+    def test_built_on_first_access(self):
+        settings = Settings()
+
+        assert settings.database_ is None
+        database = settings.database
+        assert isinstance(database, DatabaseConfig)
+        assert settings.database is database
+
+    def test_built_from_own_env_scan(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "7")
+
+        assert Settings().database.pool_size == 7
+
+    def test_explicit_values(self):
+        settings = Settings(database={"pool_size": 3})
+
+        assert settings.database.pool_size == 3
+
+    def test_assignment(self):
+        settings = Settings()
+
+        settings.database = {"pool_size": 5}
+        assert isinstance(settings.database, DatabaseConfig)
+        assert settings.database.pool_size == 5
+
+        database = DatabaseConfig(pool_size=6)
+        settings.database = database
+        assert settings.database is database
+
+    def test_dump_uses_public_names(self):
+        settings = Settings(database={"pool_size": 3})
+
+        data = settings.model_dump()
+        assert "database_" not in data
+        assert data["database"]["pool_size"] == 3
+        # Unread sub-configurations are built for the dump
+        assert data["redis"] is not None
+
+        restored = Settings(**data)
+        assert restored.database.pool_size == 3
+        assert restored.model_dump() == data
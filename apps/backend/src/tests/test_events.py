@@ -0,0 +1,104 @@
+"""Tests for batched event emission"""
+
+import asyncio
+
+from processiq.core.events import EventBus
+
+
+async def test_emit_many_dispatches_in_order():
+    bus = EventBus()
+    seen = []
+    bus.subscribe("a", lambda event: seen.append(("a", event.data["n"])))
+    bus.subscribe("b", lambda event: seen.append(("b", event.data["n"])))
+
+    await bus.emit_many([("a", {"n": 1}), ("b", {"n": 2}), ("a", {"n": 3})])
+
+    assert seen == [("a", 1), ("b", 2), ("a", 3)]
+
+
+async def test_emit_many_awaits_async_handlers_together():
+    bus = EventBus()
+    started = []
+    release = asyncio.Event()
+
+    async def handler(event):
+        started.append(event.data["n"])
+        await release.wait()
+
+    bus.subscribe_async("a", handler)
+    emitting = asyncio.ensure_future(bus.emit_many([("a", {"n": 1}), ("a", {"n": 2})]))
+
+    # Both handlers start before either finishes
+    while len(started) < 2:
+        await asyncio.sleep(0)
+    assert not emitting.done()
+
+    release.set()
+    await emitting
+    assert started == [1, 2]
+
+
+async def test_emit_many_shares_timestamp_and_records_history():
+    bus = EventBus()
+
+    await bus.emit_many([("a", {}), ("b", {})], source="plugins")
+
+    history = bus.get_recent_events()
+    assert [event.name for event in history] == ["a", "b"]
+    assert {event.source for event in history} == {"plugins"}
+    assert history[0].timestamp == history[1].timestamp
+
+
+async def test_emit_many_isolates_handler_errors():
+    bus = EventBus()
+    seen = []
+
+    def failing(event):
+        raise RuntimeError("boom")
+
+    async def failing_async(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe("a", failing)
+    bus.subscribe("a", lambda event: seen.append("sync"))
+    bus.subscribe_async("a", failing_async)
+
+    async def record(event):
+        seen.append("async")
+
+    bus.subscribe_async("a", record)
+
+    await bus.emit_many([("a", {})])
+
+    assert seen == ["sync", "async"]
+
+
+async def test_emit_many_with_no_events():
+    bus = EventBus()
+
+    await bus.emit_many([])
+
+    assert bus.get_recent_events() == []
+
+
+async def test_emit_many_trims_history():
+    bus = EventBus()
+    bus._max_history = 3
+
+    await bus.emit_many([("e", {"n": n}) for n in range(5)])
+
+    assert [event.data["n"] for event in bus.get_recent_events()] == [2, 3, 4]
+
+
+async def test_emit_and_emit_many_share_history_cap():
+    bus = EventBus()
+    bus._max_history = 3
+    seen = []
+    bus.subscribe("e", lambda event: seen.append(event.data["n"]))
+
+    await bus.emit_many([("e", {"n": n}) for n in range(2)])
+    await bus.emit("e", {"n": 2})
+    await bus.emit("e", {"n": 3})
+
+    assert seen == [0, 1, 2, 3]
+    assert [event.data["n"] for event in bus.get_recent_events()] == [1, 2, 3]
@@ -0,0 +1,226 @@
+"""Tests for the file connector"""
+
+import importlib.util
+import os
+
+import pytest
+
+from processiq.connectors import file
+from processiq.connectors.file import (
+    DiscoveredFiles,
+    FileConnector,
+    FileConnectorConfig,
+    FileType,
+    ParseCache,
+    _stat_paths,
+)
+from processiq.core.events import EventBus
+
+
+def make_file_info(path, file_type, size=10, mtime_ns=1):
+    return {
+        "path": path,
+        "name": os.path.basename(path),
+        "size": size,
+        "size_mb": size / (1024 * 1024),
+        "modified": None,
+        "mtime_ns": mtime_ns,
+        "mime_type": None,
+        "file_type": file_type,
+        "extension": os.path.splitext(path)[1],
+    }
+
+
+def test_stat_paths_skips_unstatable_entries(tmp_path, monkeypatch):
+    good = tmp_path / "good.csv"
+    good.write_text("a\n")
+    denied = str(tmp_path / "denied.csv")
+    real_stat = os.stat
+
+    def stat(path):
+        if path == denied:
+            raise PermissionError(path)
+        return real_stat(path)
+
+    monkeypatch.setattr(os, "stat", stat)
+    results = _stat_paths([str(good), str(tmp_path / "missing.csv"), denied])
+
+    assert results[0].st_size == 2
+    assert results[1:] == [None, None]
+
+
+class TestDiscoveredFiles:
+    def test_append_and_rows(self):
+        files = DiscoveredFiles()
+        info = make_file_info("/data/a.csv", FileType.CSV)
+        files.append(info)
+
+        assert len(files) == 1
+        assert files.row(0) == info
+        assert list(files) == [info]
+
+    def test_indexes(self):
+        files = DiscoveredFiles()
+        files.append(make_file_info("/data/a.csv", FileType.CSV))
+        files.append(make_file_info("/data/b.pdf", FileType.PDF))
+        files.append(make_file_info("/data/c.csv", FileType.CSV))
+
+        assert files.indices_of_type(FileType.CSV) == [0, 2]
+        assert files.indices_of_type(FileType.JSON) == []
+        assert files.index_of_path("/data/b.pdf") == 1
+        assert files.index_of_path("/data/missing.txt") is None
+        assert files.type_counts() == {FileType.CSV: 2, FileType.PDF: 1}
+        assert [info["name"] for info in files.rows([2, 0])] == ["c.csv", "a.csv"]
+
+    def test_mutations_bump_version(self):
+        files = DiscoveredFiles()
+        version = files.version
+        files.append(make_file_info("/data/a.csv", FileType.CSV))
+        assert files.version > version
+
+        version = files.version
+        files.clear()
+        assert files.version > version
+        assert len(files) == 0
+        assert files.type_counts() == {}
+        assert files.index_of_path("/data/a.csv") is None
+
+
+class TestParseCache:
+    def test_key_tracks_file_identity_and_options(self):
+        info = make_file_info("/data/a.csv", FileType.CSV)
+        key = ParseCache.key(info, None, ("utf-8",))
+
+        assert key == ParseCache.key(dict(info), None, ("utf-8",))
+        assert key != ParseCache.key({**info, "size": 11}, None, ("utf-8",))
+        assert key != ParseCache.key({**info, "mtime_ns": 2}, None, ("utf-8",))
+        assert key != ParseCache.key({**info, "path": "/data/b.csv"}, None, ("utf-8",))
+        assert key != ParseCache.key(info, 10, ("utf-8",))
+        assert key != ParseCache.key(info, None, ("latin-1",))
+
+    def test_get_and_put(self, tmp_path):
+        cache = ParseCache(tmp_path, max_size_mb=1)
+
+        assert cache.get("missing") is None
+        cache.put("k", [{"a": 1}])
+        assert cache.get("k") == [{"a": 1}]
+
+    def test_corrupt_entry_is_dropped(self, tmp_path):
+        cache = ParseCache(tmp_path, max_size_mb=1)
+        (tmp_path / "bad.pkl").write_bytes(b"not a pickle")
+
+        assert cache.get("bad") is None
+        assert not (tmp_path / "bad.pkl").exists()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ParseCache(tmp_path, max_size_mb=1)
+        for index, key in enumerate(["old", "used", "new"]):
+            cache.put(key, ["x" * 1000])
+            os.utime(tmp_path / f"{key}.pkl", ns=(index * 10**9, index * 10**9))
+
+        # Reading "used" makes it the most recently used entry
+        assert cache.get("used") is not None
+
+        entry_size = (tmp_path / "new.pkl").stat().st_size
+        cache.max_size_bytes = entry_size * 3
+        cache.put("newest", ["x" * 1000])
+
+        remaining = sorted(entry.stem for entry in tmp_path.glob("*.pkl"))
+        assert remaining == ["new", "newest", "used"]
+        assert cache._total_size == sum(entry.stat().st_size for entry in tmp_path.glob("*.pkl"))
+
+    def test_entry_evicted_during_get_is_a_miss(self, tmp_path, monkeypatch):
+        cache = ParseCache(tmp_path, max_size_mb=1)
+        cache.put("k", [1])
+
+        def utime(path, *args, **kwargs):
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(os, "utime", utime)
+        assert cache.get("k") is None
+
+    def test_puts_use_distinct_temp_files(self, tmp_path, monkeypatch):
+        cache = ParseCache(tmp_path, max_size_mb=1)
+        temp_names = []
+        real_replace = os.replace
+
+        def replace(src, dst):
+            temp_names.append(src)
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", replace)
+        cache.put("k", [1])
+        cache.put("k", [2])
+
+        assert len(set(temp_names)) == 2
+        assert cache.get("k") == [2]
+        assert [entry.name for entry in tmp_path.iterdir()] == ["k.pkl"]
+
+    def test_failed_put_leaves_no_temp_file(self, tmp_path):
+        cache = ParseCache(tmp_path, max_size_mb=1)
+
+        with pytest.raises(Exception):
+            cache.put("k", [lambda: None])
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_size_is_seeded_from_existing_entries(self, tmp_path):
+        ParseCache(tmp_path, max_size_mb=1).put("k", [1, 2, 3])
+
+        reopened = ParseCache(tmp_path, max_size_mb=1)
+        assert reopened._total_size == (tmp_path / "k.pkl").stat().st_size
+
+
+async def test_get_schema_returns_copies(tmp_path):
+    (tmp_path / "a.csv").write_text("a,b\n1,2\n")
+    connector = FileConnector(
+        FileConnectorConfig(name="files", directory_path=str(tmp_path)),
+        EventBus()
+    )
+
+    schema = await connector.get_schema()
+    expected = {
+        "total_files": schema["total_files"],
+        "file_types": dict(schema["file_types"]),
+        "files": [dict(file) for file in schema["files"]],
+    }
+    schema["total_files"] = 0
+    schema["file_types"].clear()
+    schema["files"][0]["name"] = "changed"
+    schema["files"].clear()
+
+    assert await connector.get_schema() == expected
+    assert expected["total_files"] == 1
+
+
+class FakeOCRProcessor:
+    instances = []
+
+    def __init__(self, language="eng", max_workers=4, page_seg_mode=6):
+        self.options = (language, max_workers, page_seg_mode)
+        self.closed = False
+        FakeOCRProcessor.instances.append(self)
+
+    async def close(self):
+        self.closed = True
+
+
+async def test_reconnect_reuses_or_replaces_ocr_processor(tmp_path, monkeypatch):
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+    monkeypatch.setattr(file, "OCRProcessor", FakeOCRProcessor)
+    FakeOCRProcessor.instances = []
+    config = FileConnectorConfig(name="files", directory_path=str(tmp_path), ocr_enabled=True)
+    connector = FileConnector(config, EventBus())
+
+    await connector.connect()
+    await connector.connect()
+    assert len(FakeOCRProcessor.instances) == 1
+
+    config.ocr_language = "deu"
+    await connector.connect()
+    first, second = FakeOCRProcessor.instances
+    assert first.closed
+    assert second.options[0] == "deu"
+
+    await connector.disconnect()
+    assert second.closed
@@ -0,0 +1,62 @@
+"""Tests for plugin registration and status counts"""
+
+import pytest
+
+from processiq.core.events import EventBus
+from processiq.core.plugin_manager import PluginConfig, PluginInterface, PluginManager
+
+
+class SelfInitializingPlugin(PluginInterface):
+    """Marks itself initialized, as connectors do"""
+
+    @property
+    def plugin_type(self):
+        return "test"
+
+    async def initialize(self):
+        self._mark_initialized()
+
+    async def cleanup(self):
+        pass
+
+
+@pytest.fixture
+def manager():
+    return PluginManager(EventBus())
+
+
+async def test_counts_follow_initialization(manager):
+    first = manager.register_plugin_class(SelfInitializingPlugin, PluginConfig(name="first"))
+    manager.register_plugin_class(SelfInitializingPlugin, PluginConfig(name="second"))
+    assert manager.initialized_count == 0
+
+    # Initializing outside the manager is counted, and only once
+    await first.initialize()
+    await first.initialize()
+    manager.registry.mark_initialized("first")
+    assert manager.initialized_count == 1
+
+    await manager.initialize_all_plugins()
+    assert manager.initialized_count == 2
+
+
+async def test_unregister_drops_counts(manager):
+    manager.register_plugin_class(SelfInitializingPlugin, PluginConfig(name="first"))
+    await manager.initialize_all_plugins()
+
+    manager.registry.unregister("first")
+    assert manager.initialized_count == 0
+    assert manager.enabled_count == 0
+
+    # Marking a plugin that is no longer registered is ignored
+    manager.registry.mark_initialized("first")
+    assert manager.initialized_count == 0
+
+
+def test_enabled_count_follows_config(manager):
+    plugin = manager.register_plugin_class(SelfInitializingPlugin, PluginConfig(name="first"))
+    manager.register_plugin_class(SelfInitializingPlugin, PluginConfig(name="second", enabled=False))
+    assert manager.enabled_count == 1
+
+    plugin.config.enabled = False
+    assert manager.enabled_count == 0
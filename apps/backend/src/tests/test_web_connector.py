@@ -0,0 +1,271 @@
+"""Tests for the web connector"""
+
+import asyncio
+
+import pytest
+
+from processiq.connectors import web
+from processiq.connectors.web import (
+    MIN_SUCCESS_SAMPLES,
+    STREAM_MAX_BACKOFF,
+    TRADITIONAL_REPROBE_INTERVAL,
+    WebConnector,
+    WebConnectorConfig,
+    _BrowserPool,
+)
+from processiq.core.events import EventBus
+from processiq.core.exceptions import AutomationError
+
+
+class FakeElement:
+    def __init__(self, text):
+        self._text = text
+
+    async def text_content(self):
+        return self._text
+
+
+class FakePage:
+    """Page stub answering the batched extraction script and Playwright queries"""
+
+    def __init__(self, extracted, elements=None):
+        self.extracted = extracted
+        self.elements = elements or {}
+        self.queried = []
+
+    async def evaluate(self, script, rules):
+        return self.extracted
+
+    async def query_selector_all(self, selector):
+        self.queried.append(selector)
+        return [FakeElement(text) for text in self.elements.get(selector, [])]
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    async def new_context(self, **options):
+        return FakeContext()
+
+    def is_connected(self):
+        return True
+
+    async def close(self):
+        pass
+
+
+class FakePlaywright:
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def connector():
+    return WebConnector(WebConnectorConfig(name="web"), EventBus())
+
+
+class TestSuccessRate:
+    def test_first_sample_seeds_rate(self, connector):
+        connector._update_success_rate("traditional", False)
+        assert connector._success_rates["traditional"] == 0.0
+
+        connector._update_success_rate("vision_ai", True)
+        assert connector._success_rates["vision_ai"] == 1.0
+
+    def test_moving_average(self, connector):
+        connector._update_success_rate("traditional", True)
+        connector._update_success_rate("traditional", False)
+        assert connector._success_rates["traditional"] == pytest.approx(0.9)
+
+        connector._update_success_rate("traditional", False)
+        assert connector._success_rates["traditional"] == pytest.approx(0.81)
+        assert connector._success_samples["traditional"] == 3
+
+    def test_tries_traditional_until_enough_samples(self, connector):
+        for _ in range(MIN_SUCCESS_SAMPLES - 1):
+            connector._update_success_rate("traditional", False)
+            assert connector._should_try_traditional()
+
+    def test_skips_failing_traditional_and_reprobes(self, connector):
+        for _ in range(MIN_SUCCESS_SAMPLES):
+            connector._update_success_rate("traditional", False)
+
+        decisions = [connector._should_try_traditional() for _ in range(TRADITIONAL_REPROBE_INTERVAL)]
+        assert decisions == [False] * (TRADITIONAL_REPROBE_INTERVAL - 1) + [True]
+
+    def test_keeps_succeeding_traditional(self, connector):
+        for _ in range(MIN_SUCCESS_SAMPLES):
+            connector._update_success_rate("traditional", True)
+        assert connector._should_try_traditional()
+
+    def test_always_traditional_without_vision_fallback(self):
+        connector = WebConnector(WebConnectorConfig(name="web", vision_fallback=False), EventBus())
+        for _ in range(MIN_SUCCESS_SAMPLES):
+            connector._update_success_rate("traditional", False)
+        assert connector._should_try_traditional()
+
+
+class TestExtractData:
+    async def test_no_rules(self, connector):
+        assert await connector._extract_data(FakePage({}), {}) == []
+
+    async def test_equal_columns_are_zipped(self, connector):
+        page = FakePage({"title": ["a", "b"], "price": ["1", "2"]})
+        rows = await connector._extract_data(page, {"title": "h2", "price": ".price"})
+
+        assert rows == [{"title": "a", "price": "1"}, {"title": "b", "price": "2"}]
+
+    async def test_ragged_columns_stay_in_one_row(self, connector):
+        page = FakePage({"title": ["only"], "tags": ["x", "y", "z"], "missing": []})
+        rows = await connector._extract_data(
+            page, {"title": "h1", "tags": ".tag", "missing": ".none"}
+        )
+
+        assert rows == [{"title": "only", "tags": ["x", "y", "z"], "missing": []}]
+
+    async def test_no_matches_stay_in_one_row(self, connector):
+        page = FakePage({"title": [], "price": []})
+        rows = await connector._extract_data(page, {"title": "h2", "price": ".price"})
+
+        assert rows == [{"title": [], "price": []}]
+
+    async def test_unsupported_selector_falls_back_to_playwright(self, connector):
+        page = FakePage(
+            {"title": ["a", "b"], "link": None},
+            elements={"text=More": [" x ", None]},
+        )
+        rows = await connector._extract_data(page, {"title": "h2", "link": "text=More"})
+
+        assert page.queried == ["text=More"]
+        assert rows == [{"title": "a", "link": "x"}, {"title": "b", "link": ""}]
+
+
+class TestBrowserPool:
+    async def test_limited_contexts_take_slots(self):
+        pool = _BrowserPool(FakePlaywright(), FakeBrowser(), size=1)
+
+        held = await pool.new_context(limited=True)
+        with pytest.raises(AutomationError):
+            await pool.new_context(limited=True, timeout=0.01)
+
+        # Unlimited (per-connector) contexts are not counted against the cap
+        assert await pool.new_context()
+
+        await pool.release_context(held)
+        assert held.closed
+        await pool.release_context(await pool.new_context(limited=True, timeout=0.01))
+
+    async def test_grow_adds_slots(self):
+        pool = _BrowserPool(FakePlaywright(), FakeBrowser(), size=1)
+
+        pool._grow(3)
+        pool._grow(2)
+        assert pool.size == 3
+        for _ in range(3):
+            await pool.new_context(limited=True, timeout=0.01)
+        with pytest.raises(AutomationError):
+            await pool.new_context(limited=True, timeout=0.01)
+
+    def test_pools_are_per_event_loop(self, monkeypatch):
+        monkeypatch.setattr(web, "async_playwright", FakePlaywright)
+
+        async def launch(playwright):
+            return FakeBrowser()
+
+        async def acquire_twice():
+            first = await _BrowserPool.acquire(("chromium",), launch, 2)
+            second = await _BrowserPool.acquire(("chromium",), launch, 4)
+            assert second is first
+            assert first.size == 4
+            return first
+
+        pools = [asyncio.run(acquire_twice()) for _ in range(2)]
+        assert pools[0] is not pools[1]
+        assert pools[1].size == 4
+
+
+class TestFetchDataStream:
+    """Stream scheduling against a fake clock that only sleeps advance"""
+
+    async def run_stream(self, connector, monkeypatch, outcomes, interval, fetch_time=0):
+        """Feed fetch outcomes to the stream and return its records and sleeps
+
+        Each fetch takes fetch_time seconds. The stream is cancelled at the
+        sleep following the last outcome.
+        """
+        pending = iter(outcomes)
+        records = []
+        sleeps = []
+        clock = [0.0]
+
+        async def fetch_data(query, limit=None):
+            clock[0] += fetch_time
+            outcome = next(pending)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        async def handle_error(error, context=""):
+            pass
+
+        async def sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+            if len(sleeps) == len(outcomes):
+                raise asyncio.CancelledError
+
+        monkeypatch.setattr(connector, "fetch_data", fetch_data)
+        monkeypatch.setattr(connector, "handle_error", handle_error)
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: clock[0])
+
+        with pytest.raises(asyncio.CancelledError):
+            async for record in connector.fetch_data_stream({"url": "http://a/", "interval": interval}):
+                records.append(record)
+        return records, sleeps
+
+    async def test_polls_on_fixed_ticks(self, connector, monkeypatch):
+        records, sleeps = await self.run_stream(connector, monkeypatch, [["a"], ["b"], []], interval=5)
+
+        assert records == ["a", "b"]
+        assert sleeps == [5, 5, 5]
+
+    async def test_fetch_time_does_not_push_ticks_back(self, connector, monkeypatch):
+        _, sleeps = await self.run_stream(connector, monkeypatch, [["a"], ["b"]], interval=5, fetch_time=2)
+
+        assert sleeps == [3, 3]
+
+    async def test_overrun_polls_right_away(self, connector, monkeypatch):
+        _, sleeps = await self.run_stream(connector, monkeypatch, [["a"], ["b"]], interval=5, fetch_time=7)
+
+        assert sleeps == [0, 0]
+
+    async def test_failures_back_off_and_reset(self, connector, monkeypatch):
+        error = ValueError("down")
+        _, sleeps = await self.run_stream(
+            connector, monkeypatch, [error] * 7 + [["a"], error], interval=10
+        )
+
+        assert sleeps[:7] == [10, 20, 40, 80, 160, STREAM_MAX_BACKOFF, STREAM_MAX_BACKOFF]
+        assert sleeps[7] == 10
+        assert sleeps[8] == 10
+
+    async def test_backoff_has_a_floor(self, connector, monkeypatch):
+        _, sleeps = await self.run_stream(connector, monkeypatch, [ValueError("down")] * 4, interval=0)
+
+        assert sleeps == [0, 1, 2, 4]
+
+    async def test_backoff_never_below_long_interval(self, connector, monkeypatch):
+        interval = STREAM_MAX_BACKOFF * 2
+        _, sleeps = await self.run_stream(connector, monkeypatch, [ValueError("down")] * 3, interval=interval)
+
+        assert sleeps == [interval] * 3